@@ -3,13 +3,24 @@
 
 import sys
 import os
+import re
 import time
 import traceback
 import functools
+import gc
+import signal
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import logging.handlers
+import queue
+import threading
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import win32con
+import win32gui
+import numpy as np
 
 # Fix Windows console encoding for Unicode emojis in .exe
 if sys.platform == 'win32':
@@ -25,13 +36,13 @@ if sys.platform == 'win32':
 
 # Add parent directory to path first
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-from utils.common import click_apply_ok_button
+from utils.common import click_apply_ok_button, get_roi_region, get_bottom_quarter_region
 from utils import (
-    ManualAutomationHelper, NavigationParser, play_sequence, play_sequence_async
+    ManualAutomationHelper, NavigationParser, play_sequence, play_sequence_async,
+    get_focused_hwnd, wait_for, get_window_watcher, stop_window_watcher
 )
-from utils.treeview.treeview_navigator import TreeViewNavigator
-from utils.image_scanner import scan_for_all_occurrences, scan_for_image
-from utils.graphics import ScreenOverlay, visualize_image_search
+from utils.image_scanner import ImageScanner, scan_for_all_occurrences, scan_for_image, wait_for_image, preload_templates
+from utils.graphics import get_overlay, destroy_overlays, get_async_overlay
 from helpers import select_countries, start_questionnaire
 from questionnaire_filler import QuestionnaireFiller
 from forms import DefaultQuestionnaireForms, CustomQuestionnaireForms
@@ -39,6 +50,7 @@ from forms import DefaultQuestionnaireForms, CustomQuestionnaireForms
 from dotenv import load_dotenv
 load_dotenv()
 LOCAL_DEV = os.getenv("LOCAL_DEV", "False") == "True"
+# Checked as `__debug__ and DEBUG_VISUALIZATION` at call sites so running with -O strips the debug drawing
 DEBUG_VISUALIZATION = True
 
 from enum import Enum, auto
@@ -73,13 +85,27 @@ def setup_logging():
     log_filename = os.path.join(log_dir, f'btt_automation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
     
     # Configure logging
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    # The log file is the post-mortem record of GUI-launched runs, so it keeps the per-step detail;
+    # only the console follows BTT_LOG_LEVEL (e.g. BTT_LOG_LEVEL=DEBUG in .env)
+    file_handler.setLevel(logging.DEBUG)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    stream_handler.setLevel(os.getenv("BTT_LOG_LEVEL", "INFO").upper())
+    
+    # Console/file writes happen on a background listener thread, so logging from
+    # the automation steps is only a queue put instead of a blocking console write
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Per-step detail (tree collapse iterations, clicks) is logged at DEBUG
     logging.basicConfig(
         level=logging.DEBUG,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filename, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
     
     logger = logging.getLogger(__name__)
@@ -89,6 +115,48 @@ def setup_logging():
 # Initialize logging
 logger = setup_logging()
 
+# Set when a critical step failed. The main thread checks it between steps and exits itself,
+# cleaning up once in main(), so the overlay/watcher threads are never torn down mid-call
+_stop_event = threading.Event()
+
+def _request_shutdown(signum, frame):
+    """SIGTERM handler - exit through SystemExit so main() still cleans up, like Ctrl+C's KeyboardInterrupt"""
+    logger.warning(f"🛑 Received signal {signum}, shutting down...")
+    sys.exit(1)
+
+def _exit_if_stopped():
+    """Exit with a failure code if a critical step failed; main() cleans up on the way out"""
+    if _stop_event.is_set():
+        logger.critical("INITIATING SHUTDOWN - cleaning up before exit...")
+        sys.exit(1)
+
+# "- Tree Option: <path>" / "- Test Case: <name>" lines of a test type prompt.
+# The value stops at the next colon, as the line-by-line split(":")[1] parser did
+_PROMPT_RE = re.compile(r'^[ \t]*- (Tree Option|Test Case):([^:\n]*)', re.M)
+
+def parse_prompt(prompt_text):
+    """
+    Parse prompt text to extract tree options and their test cases
+    
+    Args:
+        prompt_text: Test type prompt loaded by the selection dialog
+        
+    Returns:
+        dict: Tree option path -> list of test case names, in prompt order
+    """
+    tree_options = {}
+    current_tree_option = None
+    
+    for match in _PROMPT_RE.finditer(prompt_text):
+        kind, value = match.group(1), match.group(2).strip()
+        if kind == "Tree Option":
+            current_tree_option = value
+            tree_options[current_tree_option] = []
+        elif current_tree_option:
+            tree_options[current_tree_option].append(value)
+    
+    return tree_options
+
 # Removed Unicode emoji handling - using plain text only for .exe compatibility
 
 def critical_exception_handler(func):
@@ -105,19 +173,22 @@ def critical_exception_handler(func):
     - BTT runs as subprocess launched from GUI - hanging processes are problematic
     - User should not need to intervene when automation fails critically
     - Catching at decorator level ensures ALL critical functions are protected
-    - Using sys.exit(1) leverages existing shutdown logic (no reinventing the wheel)
+    - The failure is reported through _stop_event instead of sys.exit(1) from inside the step,
+      so the main thread runs _cleanup_resources exactly once before the process exits
     - Comprehensive logging helps debug automation failures
     
     USAGE:
     - Apply @critical_exception_handler to any function that could fail critically
-    - Already applied to: execute_all_steps(), fill_questionnaire(), main()
+    - Already applied to: execute_all_steps(), fill_questionnaire(), fill_questionnaire_v2(),
+      the custom mode handlers and main()
     - Any uncaught exception in wrapped functions triggers automatic shutdown
     
     TECHNICAL FLOW:
     1. Function executes normally if no exceptions
-    2. Any exception caught → detailed logging → sys.exit(1) 
-    3. Parent GUI process detects subprocess death via monitoring
-    4. GUI button resets from "Stop BTT" back to "BTT"
+    2. Any exception caught → detailed logging → _stop_event set, wrapper returns None
+    3. main() sees the event and calls sys.exit(1); its finally block cleans up
+    4. Parent GUI process detects subprocess death via monitoring
+    5. GUI button resets from "Stop BTT" back to "BTT"
     
     FUTURE MAINTENANCE:
     - Add this decorator to any new critical BTT functions
@@ -135,7 +206,7 @@ def critical_exception_handler(func):
             logger.critical(f"Exception Type: {type(e).__name__}")
             logger.critical("Full Traceback:")
             logger.critical(traceback.format_exc())
-            logger.critical("INITIATING ULTIMATE SHUTDOWN - Process will terminate automatically...")
+            logger.critical("STOPPING AUTOMATION - Process will terminate automatically...")
             
             # Also print to console for immediate visibility
             print(error_msg)
@@ -143,35 +214,51 @@ def critical_exception_handler(func):
             print(f"Exception Type: {type(e).__name__}")
             print("\nFull Traceback:")
             traceback.print_exc()
-            print(f"\nINITIATING ULTIMATE SHUTDOWN - Process will terminate automatically...")
-            
-            # Try to clean up resources before shutdown
-            try:
-                # If this is a method call on a BrandTestToolAutomation instance
-                if args and hasattr(args[0], '_cleanup_resources'):
-                    logger.info("Attempting emergency resource cleanup...")
-                    print("Attempting emergency resource cleanup...")
-                    args[0]._cleanup_resources()
-            except Exception as cleanup_error:
-                logger.error(f"Emergency cleanup failed: {cleanup_error}")
-                print(f"Emergency cleanup failed: {cleanup_error}")
+            print(f"\nSTOPPING AUTOMATION - Process will terminate automatically...")
             
             logger.critical("=" * 60)
             print("=" * 60)
             
-            # Use existing ultimate shutdown mechanism - don't reinvent the wheel
-            sys.exit(1)
+            # The main thread cleans up and exits once control returns to it
+            _stop_event.set()
+            return None
             
     return wrapper
 
 class BrandTestToolAutomation:
     """Automation class for Brand Test Tool with modular step control"""
     
+    # Menu paths used every run - parsed once when the class is defined
+    NEW_PROJECT_NAV = NavigationParser.parse_navigation_path("{Alt+F} -> {Down 1} -> {Enter}")
+    EXPORT_NAV = NavigationParser.parse_navigation_path("{Alt+F} -> {Down 3} -> {Enter}")
+    
+    # Template images scanned for during a run
+    TEMPLATES = ["minus-expanded.png", "start-tse-test-session.png", "edit-tse-test-session.png",
+                 "edit-answers.png", "confirm-information-btn.png", "use-suggested-value-btn.png",
+                 "apply-btn-normal.png", "ok-btn-normal.png", "ok-btn-focussed.png"]
+    
+    # Longest wait for the background fill_project_details sequence once Project Settings is open (seconds)
+    PROJECT_DETAILS_TIMEOUT = 30.0
+    
+    # Upper bound for the per-key focus wait in send_tabs (the old fixed delay)
+    NANO_WAIT_MAX = 0.2
+    
+    # Timed-out focus waits on one control before send_tabs stops waiting for focus to leave it
+    FOCUS_WAIT_MISS_LIMIT = 2
+    
     def __init__(self):
         logger.info(f"Initializing BrandTestToolAutomation...")
         self.window_title = WindowTitle.MAIN_WINDOW.value
         logger.info(f"Looking for window: '{self.window_title}'")
         
+        # Background worker for scans that can overlap with UI settle time
+        self._scan_pool = ThreadPoolExecutor(max_workers=1)
+        # The questionnaire/settings windows don't exist yet, but the watcher that picks them up
+        # (hook install + initial window enumeration) can be set up while the main window is focused
+        self._watcher_future = self._scan_pool.submit(get_window_watcher)
+        # Decode the templates used during the run before the first scan needs them
+        self._scan_pool.submit(preload_templates, self.TEMPLATES)
+        
         # Initialize automation helper with the found window handle
         self.automation_helper = ManualAutomationHelper(target_window_title=self.window_title)
         
@@ -181,20 +268,28 @@ class BrandTestToolAutomation:
             raise Exception(error_msg)
         
         self.window_handle = self.automation_helper.hwnd
-        self.window_info = self.automation_helper.get_window_info()
         logger.info(f"Found window - Handle: {self.window_handle}")
-        logger.info(f"Window info: {self.window_info}")
         
-        self.graphics = ScreenOverlay()
+        # The same overlay the image scans draw on - one Tk root for all on-screen markers
+        self.graphics = get_overlay()
         self.project_name = ""
         
+        # Completion of the background fill_project_details sequence (set by create_new_project)
+        self._project_details_done = None
+        self._project_details_ok = False
+        
         # Configuration storage
         self.config = None
+        self._tree_options = {}  # Parsed from the test type prompt by set_config
+        # Controls on which Tab did not move the focus handle (e.g. windowless grids), with their
+        # timed-out waits; cleared by execute_all_steps because window handles are reused
+        self._focus_wait_misses = {}
         logger.info("BrandTestToolAutomation initialized successfully")
 
     def set_config(self, config):
         """Set the automation configuration from the selection dialog"""
         self.config = config
+        self._tree_options = parse_prompt(config.get('test_type_prompt', ''))
         print(f"Configuration set: {config['test_type']} - {config['execution_mode']}")
         
     def get_config(self):
@@ -246,15 +341,18 @@ class BrandTestToolAutomation:
         
         safe_print("=" * 50)
 
-    def _cleanup_resources(self):
+    def _cleanup_resources(self, run_gc=False):
         """
         Clean up all resources used during automation to ensure proper termination.
         
         Resources cleaned up:
         - Graphics overlays and debug visualizations
-        - Window handles and automation helpers
+        - Window event hook
         - Configuration data and memory
-        - Temporary files or processes
+        
+        Args:
+            run_gc: Force a full garbage collection afterwards. Only worth it when the process
+                keeps running - every current caller exits right after cleaning up
         """
         print("🧹 Cleaning up automation resources...")
         
@@ -264,23 +362,26 @@ class BrandTestToolAutomation:
                 print("   🎨 Cleaning up graphics overlay...")
                 # Close any open overlay windows
                 try:
+                    destroy_overlays()
                     self.graphics = None
                 except:
                     pass
             
-            # Reset automation state 
-            print("   🔄 Resetting automation state...")
-            self.reset()
+            # Remove the window event hook, if one was installed
+            print("   🪝 Stopping window watcher...")
+            stop_window_watcher()
+            
+            # Background scans are of no use any more
+            self._scan_pool.shutdown(wait=False)
             
             # Clear configuration data
             if hasattr(self, 'config') and self.config:
                 print("   ⚙️ Clearing configuration data...")
                 self.config = None
             
-            # Force garbage collection to free memory
-            print("   🗑️ Performing garbage collection...")
-            import gc
-            gc.collect()
+            if run_gc:
+                print("   🗑️ Performing garbage collection...")
+                gc.collect()
             
             print("   ✅ Resource cleanup completed")
             
@@ -288,112 +389,35 @@ class BrandTestToolAutomation:
             print(f"   ⚠️ Warning: Some resources may not have been cleaned up properly: {e}")
 
     def _show_debug_visualization(self, search_region, found_locations=None, target_location=None, duration=3):
-        """Show clean debug visualization using a temporary transparent window"""
-        if not DEBUG_VISUALIZATION:
-            return
-            
-        import tkinter as tk
-        import threading
-        import time as time_module
-        
-        def create_and_show():
-            # Create a temporary transparent window
-            root = tk.Tk()
-            root.withdraw()  # Hide initially
-            
-            # Make it fullscreen and completely transparent
-            root.attributes('-fullscreen', True)
-            root.attributes('-topmost', True)
-            root.attributes('-alpha', 1.0)  # Fully opaque for the shapes
-            root.overrideredirect(True)
-            
-            # Make the window background Start at selected Questions
-            try:
-                root.wm_attributes('-transparentcolor', 'black')
-            except:
-                pass
-            
-            # Create transparent canvas with black background (which becomes transparent)
-            canvas = tk.Canvas(root, bg='black', highlightthickness=0)
-            canvas.pack(fill=tk.BOTH, expand=True)
-            
-            # Draw search region rectangle (green)
-            canvas.create_rectangle(
-                search_region[0], search_region[1], search_region[2], search_region[3],
-                outline='#00FF00', width=3, fill=''
-            )
-            
-            # Draw found locations (red circles)
-            if found_locations:
-                for x, y in found_locations:
-                    canvas.create_oval(
-                        x-15, y-15, x+15, y+15,
-                        outline='#FF0000', width=3, fill=''
-                    )
-            
-            # Draw target location (yellow circle, larger)
-            if target_location:
-                x, y = target_location
-                canvas.create_oval(
-                    x-25, y-25, x+25, y+25,
-                    outline='#FFFF00', width=5, fill=''
-                )
-            
-            # Show the window
-            root.deiconify()
-            root.update()
-            
-            # Auto-hide after duration
-            def cleanup():
-                time_module.sleep(duration)
-                try:
-                    root.destroy()
-                except:
-                    pass
-            
-            threading.Thread(target=cleanup, daemon=True).start()
-            
-            # Start the window's event loop in this thread
-            try:
-                root.mainloop()
-            except:
-                pass
-        
-        # Run in separate thread to avoid blocking
-        threading.Thread(target=create_and_show, daemon=True).start()
+        """Show debug visualization on the overlay thread without blocking the caller"""
+        get_async_overlay().show(search_region, found_locations, target_location, duration)
 
-    def send_navigation_keys(self, navigation_path="{Alt+F} -> {Down 1} -> {Enter}"):
-        """Send navigation keys using the navigation parser"""
+    def send_navigation_keys(self, navigation_path=NEW_PROJECT_NAV):
+        """
+        Send navigation keys using the navigation parser
+        
+        Args:
+            navigation_path: Navigation string, or a step list from NavigationParser.parse_navigation_path
+        """
         try:
-            print(f"⌨️ Step 3: Sending navigation keys: '{navigation_path}'...")
+            if isinstance(navigation_path, str):
+                logger.info("⌨️ Step 3: Sending navigation keys: '%s'...", navigation_path)
+            else:
+                logger.info("⌨️ Step 3: Sending navigation keys: %s...", " -> ".join(step['original'] for step in navigation_path))
             
             if not self.automation_helper:
-                print("❌ No automation helper available. Run bring_to_focus() first.")
+                logger.error("❌ No automation helper available. Run bring_to_focus() first.")
                 return False
             
-            # Parse the navigation path
-            steps = NavigationParser.parse_navigation_path(navigation_path)
-            
-            if not steps:
-                print("❌ Failed to parse navigation path")
+            if not NavigationParser.navigate(navigation_path, self.automation_helper):
+                logger.error("❌ Failed to execute navigation steps")
                 return False
             
-            print(f"📝 Parsed {len(steps)} navigation steps")
-            
-            # Execute each step using Windows API
-            for i, step in enumerate(steps, 1):
-                print(f"  Step {i}/{len(steps)}: {step['description']}")
-                success = NavigationParser.execute_step_windows(step, self.automation_helper)
-                if not success:
-                    print(f"❌ Failed to execute step {i}")
-                    return False
-                time.sleep(0.2)  # Small delay between steps
-            
-            print("✅ All navigation steps executed successfully!")
+            logger.info("✅ All navigation steps executed successfully!")
             return True
             
         except Exception as e:
-            print(f"❌ Step 3 failed: {e}")
+            logger.error("❌ Step 3 failed: %s", e)
             return False
     
     def export_file_done(self):
@@ -403,17 +427,21 @@ class BrandTestToolAutomation:
         # opens the dialog to select file
         # Export dialog
         self.automation_helper._bring_to_focus()
-        time.sleep(1)
-        self.send_navigation_keys('{Alt+F} -> {Down 3} -> {Enter}')
+        wait_for(lambda: win32gui.GetForegroundWindow() == self.automation_helper.hwnd, timeout=1.0)
+        self.send_navigation_keys(self.EXPORT_NAV)
         
-        time.sleep(1)
-        if not (etpp := ManualAutomationHelper(target_window_title="Export TPP Package Wizard")):
+        # The watcher reports the wizard as soon as it opens
+        if not (etpp_hwnd := get_window_watcher().wait_for_window("Export TPP Package Wizard", timeout=5.0)):
             print("❌ No Export TPP Package Wizard window found")
             return False
+        etpp = ManualAutomationHelper(window_handle=etpp_hwnd)
 
         # this etpp window is to be using this bounding box {l:411 t:141 r:922 b:596}
         etpp.setup_window(bbox=(411, 141, 922, 596))
-        time.sleep(1)
+        # The recorded sequence clicks by coordinates - wait until the moved wizard is in front and
+        # has finished repainting (1 s cap each, as the old fixed delay)
+        wait_for(lambda: win32gui.GetForegroundWindow() == etpp_hwnd, timeout=1.0)
+        ImageScanner().wait_region_stable((411, 141, 922 - 411, 596 - 141), timeout=1.0)
         
         # playing export sequence
         print("🔍 Playing export sequence...")
@@ -427,144 +455,215 @@ class BrandTestToolAutomation:
     
     def create_new_project(self):
         """Create a new project"""
-        print("🚀 Starting {self.window_title} automation...")
+        logger.info("🚀 Creating new project in %s...", self.window_title)
         
         # generate a random project name and save this in self so that when exporting we use the same name to save the file with
         self.project_name = f"sample_test_project_{int(time.time())}"
         
         # Send navigation keys to create project
-        if not self.send_navigation_keys(navigation_path="{Alt+F} -> {Down 1} -> {Enter}"):
+        if not self.send_navigation_keys(navigation_path=self.NEW_PROJECT_NAV):
             return False
         
-        time.sleep(0.5)
+        # The new project dialog takes the foreground from the main window when it opens;
+        # 0.5 s stays the cap, and the dialog's thread must have finished creating it
+        wait_for(lambda: win32gui.GetForegroundWindow() not in (0, self.window_handle), timeout=0.5)
+        self.automation_helper.wait_idle(timeout_ms=500, hwnd=win32gui.GetForegroundWindow())
         
-        # Run sequence to fill in project name and description
-        print("🎬 Running sequence to fill project details...")
-        success = play_sequence("fill_project_details", blocking=True, project_name=self.project_name)
-        if not success:
-            print("❌ Failed to run sequence")
+        # Run sequence to fill in project name and description in the background; it ends by opening
+        # the Project Settings window, which prepare_project_setup_window is already waiting for
+        logger.info("🎬 Running sequence to fill project details...")
+        self._project_details_done = threading.Event()
+        self._project_details_ok = False
+        
+        def on_complete(_name):
+            self._project_details_ok = True
+            self._project_details_done.set()
+        
+        def on_error(_message):
+            self._project_details_done.set()
+        
+        if not play_sequence_async("fill_project_details", on_complete=on_complete, on_error=on_error,
+                                   project_name=self.project_name):
+            logger.error("❌ Failed to run sequence")
             return False
         
         return True
-    def collapse_tree_items(self,automation_helper=None):
+    def collapse_tree_items(self, automation_helper=None, search_region=None):
         """
         Collapse all tree items by clicking minus-expanded.png images from bottom to top.
         Searches only in the top-left 30% of the window's bounding box.
+        
+        Args:
+            automation_helper: Helper for the window containing the tree
+            search_region: Optional precomputed (search_bbox, search_bounding_box) from get_roi_region
         """
         
         if automation_helper is None and not LOCAL_DEV:
             raise ValueError("automation_helper is required when not in local development mode")
         
-        # Get the window's bounding box
-        if LOCAL_DEV:
-            bbox = (100, 100, 1050, 646)
-        else:
-            bbox = automation_helper.get_bbox()
-        left, top, right, bottom = bbox
-        
-        # Calculate the top-left 30% region
-        search_width = int((right - left) * 0.3)  # 30% of width
-        search_height = int((bottom - top) * 0.5)  # 50% of height
-        search_region = (left, top, left + search_width, top + search_height)
+        # The tree occupies the left 30% of the window, full height; the window bbox is only
+        # needed when the caller has not already computed that region
+        if search_region is None:
+            bbox = (100, 100, 1050, 646) if LOCAL_DEV else automation_helper.get_bbox()
+            logger.debug("📐 Window bbox: %s", bbox)
+            search_region = get_roi_region(bbox, frac_x=(0, 0.3), frac_y=(0, 1.0))
+        search_region, search_bounding_box = search_region
         
-        print(f"📐 Window bbox: {bbox}")
-        print(f"🔍 Search region (top-left 30%): {search_region}")
+        logger.debug("🔍 Search region (left 30%%, full height): %s", search_region)
         
-        max_iterations = 7  # Maximum consecutive failed attempts
+        max_iterations = 7  # Maximum consecutive failed attempts while the tree may still be loading
         iteration = 0
+        collapsed_any = False  # Once a click pass has run, one empty verification scan ends the loop
+        empty_digest = None  # Settled look of the tree after the last empty scan
+        
+        scan_args = dict(image_name="minus-expanded.png", bounding_box=search_bounding_box,
+                         threshold=0.8, pyramid_levels=2, as_array=True)
+        next_scan = None  # Scan started in the background after the previous click pass
+        scanner = ImageScanner()
         
         while iteration < max_iterations:
-            print(f"\n🔄 Iteration {iteration + 1}: Searching for expanded tree items...")
+            logger.debug("🔄 Iteration %d: Searching for expanded tree items...", iteration + 1)
             
             # Visual debug: Show search region
-            if DEBUG_VISUALIZATION:
-                print(f"🔍 Search region: {search_region}")
+            if __debug__ and DEBUG_VISUALIZATION:
+                logger.debug("🔍 Search region: %s", search_region)
                 self._show_debug_visualization(search_region, duration=2)
             
             # Search for all minus-expanded.png images in the search region
-            results = scan_for_all_occurrences(
-                image_name="minus-expanded.png",
-                bounding_box=search_region,
-                threshold=0.8
-            )
+            if next_scan is not None:
+                results = next_scan.result()
+                next_scan = None
+            else:
+                results = scan_for_all_occurrences(**scan_args)
             
-            if not results or len(results) == 0:
+            # results is an (N, 2) array of x/y columns
+            if len(results) == 0:
+                if collapsed_any:
+                    logger.info("✅ Verification scan found no expanded tree items. Collapse complete!")
+                    break
+                # The tree may still be loading - rescan once it stops changing. If it settles
+                # looking the same as after the previous empty scan, there is nothing left to find
+                digest = scanner.wait_region_stable(search_bounding_box)
+                if digest is not None and digest == empty_digest:
+                    logger.info("✅ Tree settled without expanded items. Collapse complete!")
+                    break
+                empty_digest = digest
                 iteration += 1  # Increment counter for failed attempt
-                print(f"❌ No expanded tree items found. Failed attempt {iteration}/{max_iterations}")
+                logger.debug("❌ No expanded tree items found. Failed attempt %d/%d", iteration, max_iterations)
                 # Visual debug: Show final search region with no matches
-                if DEBUG_VISUALIZATION:
-                    print("🎯 No expanded items found in this iteration")
+                if __debug__ and DEBUG_VISUALIZATION:
+                    logger.debug("🎯 No expanded items found in this iteration")
                     self._show_debug_visualization(search_region, duration=2)
                 
                 if iteration >= max_iterations:
-                    print("✅ No more expanded tree items found after 3 consecutive attempts. Collapse complete!")
+                    logger.info("✅ No expanded tree items found after %d consecutive attempts. Collapse complete!", max_iterations)
                     break
                 continue
             
-            print(f"📍 Found {len(results)} expanded tree items")
+            logger.debug("📍 Found %d expanded tree items", len(results))
             iteration = 0  # Reset counter when matches are found
             
             # Visual debug: Show complete visualization with all elements
-            if DEBUG_VISUALIZATION:
-                print(f"🎯 Found locations: {results}")
-                sorted_results = sorted(results, key=lambda x: x[1], reverse=True)
-                print(f"🎯 Will click bottommost at: {sorted_results[0] if sorted_results else 'None'}")
+            if __debug__ and DEBUG_VISUALIZATION:
+                logger.debug("🎯 Found locations: %s", results.tolist())
+                target_location = tuple(results[np.argmax(results[:, 1])].tolist())
+                logger.debug("🎯 Will click bottommost at: %s", target_location)
                 
-                target_location = sorted_results[0] if sorted_results else None
                 self._show_debug_visualization(
                     search_region=search_region,
-                    found_locations=results,
+                    found_locations=results.tolist(),
                     target_location=target_location,
                     duration=3
                 )
             
-            # Sort results by Y coordinate (bottom to top)
-            # results format: [(x, y), ...]
-            sorted_results = sorted(results, key=lambda x: x[1], reverse=True)
+            # Order by Y coordinate (bottom to top)
+            sorted_results = results[np.argsort(results[:, 1])[::-1]].tolist()
             
-            # Click the bottommost expanded item
-            center_x, center_y = sorted_results[0]
-            print(f"🖱️  Clicking bottommost expanded item at ({center_x}, {center_y})")
+            # Collapsing a node only moves the rows below it, so every match found by this one scan
+            # can be clicked bottom-up in a single pass before rescanning
+            # The tree window normally keeps the focus between passes - only re-focus when it lost it
+            if win32gui.GetForegroundWindow() != automation_helper.hwnd:
+                automation_helper._bring_to_focus()
+                wait_for(lambda: win32gui.GetForegroundWindow() == automation_helper.hwnd, timeout=0.2)
             
-            # Ensure window is focused and try multiple click approaches
-            automation_helper._bring_to_focus()
-            time.sleep(0.2)
-            
-            # Try direct click first
-            success = automation_helper.click((center_x, center_y))
-            
-            # If that fails, try a more aggressive approach
-            if not success:
-                print(f"⚠️  Direct click failed, trying alternative methods...")
-                # Try moving mouse first, then clicking
-                automation_helper.move_mouse(center_x, center_y)
-                time.sleep(0.1)
+            success = True
+            collapsed = 0
+            for center_x, center_y in sorted_results:
+                logger.debug("🖱️  Clicking expanded item at (%d, %d)", center_x, center_y)
+                
+                # Try direct click first
                 success = automation_helper.click((center_x, center_y))
+                
+                # If that fails, try a more aggressive approach
+                if not success:
+                    logger.warning("⚠️  Direct click failed, trying alternative methods...")
+                    # Try moving mouse first, then clicking
+                    automation_helper.move_mouse(center_x, center_y)
+                    automation_helper.wait_idle(timeout_ms=100)
+                    success = automation_helper.click((center_x, center_y))
+                
+                if not success:
+                    logger.error("❌ All click methods failed at (%d, %d)", center_x, center_y)
+                    break
+                
+                # Verify the click by matching the minus icon only around the clicked point,
+                # continuing as soon as it is gone instead of after a fixed delay
+                if wait_for(lambda: scanner.match_score_around(scan_args["image_name"], (center_x, center_y))
+                            < scan_args["threshold"], timeout=0.5):
+                    collapsed += 1
             
             if not success:
-                print(f"❌ All click methods failed at ({center_x}, {center_y})")
                 break
+            logger.debug("✅ Collapsed %d/%d items (verified locally)", collapsed, len(sorted_results))
+            collapsed_any = True
+            
+            # Rows above the topmost collapsed node did not move and held no other expanded items,
+            # so when every click was verified only the band from there down needs rescanning
+            rescan_args = dict(scan_args)
+            if collapsed == len(sorted_results):
+                x, y, width, height = search_bounding_box
+                template_height = scanner.load_template(scan_args["image_name"], grayscale=True).shape[0]
+                band_top = max(y, sorted_results[-1][1] - 2 * template_height)
+                rescan_args["bounding_box"] = (x, band_top, width, y + height - band_top)
             
-            # Wait for the UI to update
-            time.sleep(0.5)
+            # The rescan for the next iteration runs while the debug visualization is shown
+            next_scan = self._scan_pool.submit(scan_for_all_occurrences, show_overlay=False, **rescan_args)
         
         if iteration >= max_iterations:
-            print(f"⚠️  Reached maximum iterations ({max_iterations}). Stopping to prevent infinite loop.")
+            logger.warning("⚠️  Reached maximum iterations (%d). Stopping to prevent infinite loop.", max_iterations)
         
         #now that all tree is collapsed, just send one right key to ensure the root is focussed
         automation_helper.keys("{Right}")
         
-        print("🎉 Tree collapse process completed!")
+        logger.info("🎉 Tree collapse process completed!")
 
     def prepare_project_setup_window(self):
         """Identify the project setup window. Then ready the treeview for navigation"""
-        # Now the Project Settings Window is open
-        # Search for a new window
-        project_setup_window_handle = ManualAutomationHelper(target_window_title=WindowTitle.PROJECT_SETTINGS.value, title_starts_with=True)
+        # The fill_project_details sequence opens the Project Settings window when it finishes.
+        # Wait for the new window to be reported by the window watcher while the sequence is still running,
+        # in short slices so a sequence that already failed does not cost the full timeout
+        details_done = self._project_details_done
+        watcher = get_window_watcher()
+        deadline = time.time() + 10.0
+        while not (project_setup_hwnd := watcher.wait_for_window(WindowTitle.PROJECT_SETTINGS.value,
+                                                                 timeout=0.5, starts_with=True)):
+            if details_done is not None and details_done.is_set() and not self._project_details_ok:
+                print("❌ Failed to run sequence")
+                return False
+            if time.time() >= deadline:
+                print("❌ No Project Setup window found")
+                return False
+        
+        # The window can show up before the sequence's last steps have run
+        if details_done is not None:
+            if not details_done.wait(timeout=self.PROJECT_DETAILS_TIMEOUT):
+                print("❌ Sequence did not finish in time")
+                return False
+            if not self._project_details_ok:
+                print("❌ Failed to run sequence")
+                return False
+        project_setup_window_handle = ManualAutomationHelper(window_handle=project_setup_hwnd)
         print(f"✅ Found Project Setup window: {project_setup_window_handle.hwnd}")
-        if not project_setup_window_handle.hwnd:
-            print("❌ No Project Setup window found")
-            return False
         
         # # Reposition the window to the desired location such that we can play sequences as recorded and coordinates will not be messed up
         project_setup_window_handle.setup_window(bbox=(100, 100, 1050, 646))
@@ -572,12 +671,9 @@ class BrandTestToolAutomation:
         # GOAL: To collapse all tree items from bottom up, so we are guaranteed how the UI looks like
         # use the image search to search for all image in the setup window handle bounding box, the top left 30% of the bounding box only.
         # any images minus-expanded.png found should be clicked from bottom up one at a time, until none is found.
-        bbox = project_setup_window_handle.get_bbox()
-        left, top, right, bottom = bbox
-        search_width = int((right - left) * 0.3)  # 30% of width
-        search_height = int((bottom - top))  # 50% of height
-        search_region = (left, top, left + search_width, top + search_height)
-        self.collapse_tree_items(project_setup_window_handle)
+        # The tree occupies the left 30% of the window, full height
+        search_region = get_roi_region(project_setup_window_handle.get_bbox(), frac_x=(0, 0.3), frac_y=(0, 1.0))
+        self.collapse_tree_items(project_setup_window_handle, search_region=search_region)
         # Assume at this point that the tree is fully collapsed to the very first root level
         # and that it is currently getting focussed
         
@@ -652,17 +748,15 @@ class BrandTestToolAutomation:
         if not forms.test_session_name("some test session name"):
             return False
         
-        # Final step - with all successful, we have a screen where OK button is auto highlighted
-        time.sleep(3)
-        edit_window.keys("{space}")
+        # Final step - with all successful, we have a screen where OK button is auto highlighted.
+        # Wait for the highlighted button to show up, with the old 3 s delay as the cap
+        _, ok_region = get_bottom_quarter_region(edit_window.get_bbox())
+        if not wait_for_image("ok-btn-focussed.png", ok_region, timeout=3.0):
+            print("⚠️ Highlighted OK button not found, confirming anyway")
+        edit_window.keys_post(["{space}"])
         
         print("🎉 All automation steps completed successfully!")
-        
-        # Clean up resources before exit
-        self._cleanup_resources()
-        
-        print('Task completed. Exiting...')
-        exit()
+        return True
     
     @critical_exception_handler
     def fill_questionnaire_v2(self, questionnaire_window, forms_class=None):
@@ -683,100 +777,102 @@ class BrandTestToolAutomation:
     @critical_exception_handler
     def execute_all_steps(self):
         """Execute all steps in sequence"""
-        print(f"🚀 Starting {self.window_title} automation...")
+        # Deferred so that starting the script (and the selection dialog) does not load the navigator stack
+        from utils.treeview.treeview_navigator import TreeViewNavigator
+        logger.info(f"🚀 Starting {self.window_title} automation...")
         
         if not self.window_handle:
             return False
+        
+        # Handles seen by an earlier run may now belong to other controls
+        self._focus_wait_misses.clear()
+        
+        # Make sure new windows are being tracked before any dialogs are opened
+        self._watcher_future.result()
      
-        if not self.create_new_project():
+        if not self.create_new_project() or _stop_event.is_set():
             return False
        
-        time.sleep(1)
-        
-        if not (project_setup_window_handle := self.prepare_project_setup_window()):
+        if not (project_setup_window_handle := self.prepare_project_setup_window()) or _stop_event.is_set():
             return False
         
-        configuration = self.config["test_type_prompt"]
-        # Parse configuration from prompt
-        def parse_prompt(prompt_text):
-            """Parse prompt text to extract tree options and their test cases"""
-            tree_options = {}
-            current_tree_option = None
-            
-            for line in prompt_text.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                if line.startswith("- Tree Option:"):
-                    current_tree_option = line.split(":")[1].strip()
-                    tree_options[current_tree_option] = []
-                elif line.startswith("- Test Case:") and current_tree_option:
-                    test_case = line.split(":")[1].strip()
-                    tree_options[current_tree_option].append(test_case)
-            
-            return tree_options
-        
-        
-        tree_options = parse_prompt(configuration)
-        print(f"📝 Parsed configuration - Tree Options: {tree_options}")
+        # Parsed once by set_config
+        tree_options = self._tree_options
+        logger.info(f"📝 Parsed configuration - Tree Options: {tree_options}")
         
         # Now we are ready to navigate to the node we want to edit
         for tree_option, test_cases in tree_options.items():
             navigator = TreeViewNavigator(automation_helper=project_setup_window_handle, collapse_count=2)
-            time.sleep(1.5)
+            wait_for(lambda: win32gui.GetForegroundWindow() == project_setup_window_handle.hwnd, timeout=1.5)
             navigator.navigate_to_path(tree_option)
             for test_case in test_cases:
-                time.sleep(0.2)
-                project_setup_window_handle.keys("{space}")
-                time.sleep(1) # gives time for the right panel to get populated
+                if _stop_event.is_set():
+                    return False
+                project_setup_window_handle.wait_idle(timeout_ms=200)
+                project_setup_window_handle.keys_post(["{space}"])
+                # start_questionnaire keeps scanning until the right panel is populated
                 
                 if test_case == "VisaL3Testing_Series01_Build_021":
                     questionnaire_window = start_questionnaire(project_setup_window_handle, questionnaire_window_title="Edit EMVCo L3 Test Session - Questionnaire")
                     if not questionnaire_window:
-                        print("❌ No questionnaire window found")
+                        logger.error("❌ No questionnaire window found")
                         return False
                     
-                    time.sleep(1)
+                    wait_for(lambda: win32gui.GetForegroundWindow() == questionnaire_window.hwnd, timeout=1.0)
         
                     # Option 1: Use default forms with manual method calls
                     self.fill_questionnaire_v2(questionnaire_window)
                 else:
-                    print(f"🔴 Test case {test_case} not implemented yet")
+                    logger.info(f"🔴 Test case {test_case} not implemented yet")
+        
+        if _stop_event.is_set():
+            return False
 
         # click on the apply ok on the Project Settings window
-        print('Attempting to click on apply/ok on Project Settings window')
-        time.sleep(2)
+        logger.info('Attempting to click on apply/ok on Project Settings window')
+        # Focus returns to Project Settings once the questionnaire window has closed
+        wait_for(lambda: win32gui.GetWindowText(win32gui.GetForegroundWindow()).startswith(WindowTitle.PROJECT_SETTINGS.value), timeout=2.0)
         
         # we are recapturing the window as it could have been stale by this time.
-        if not (pwin:= ManualAutomationHelper(target_window_title=WindowTitle.PROJECT_SETTINGS.value, title_starts_with=True)):
-            print("❌ No project settings window found")
+        if not (pwin_hwnd := get_window_watcher().wait_for_window(WindowTitle.PROJECT_SETTINGS.value, starts_with=True)):
+            logger.error("❌ No project settings window found")
             return False
+        pwin = ManualAutomationHelper(window_handle=pwin_hwnd)
         
         # Get bottom 1/4 region to avoid false positives with similar buttons in middle of window
-        from utils.common import get_bottom_quarter_region
         search_region = get_bottom_quarter_region(pwin.get_bbox())
         click_apply_ok_button(pwin, search_region=search_region)
         
-        print("✅ BTT Automation completed successfully!")
+        logger.info("✅ BTT Automation completed successfully!")
         return True
     
     def send_tabs(self, automation_helper, count, followed_by_space=False, followed_by_enter=False, start_delay=0.01, end_delay=0.01):
         time.sleep(start_delay)
-        for _ in range(count):
-            time.sleep(0.2)
-            automation_helper.keys("{tab}")
-            
-        time.sleep(end_delay)
-            
+
+        previous_focus = get_focused_hwnd()
+        # Build the whole key sequence and send it as one SendInput batch
+        vks = [win32con.VK_TAB] * count
         if followed_by_space:
-            time.sleep(0.2)
-            automation_helper.keys("{space}")
-            
+            vks.append(win32con.VK_SPACE)
         if followed_by_enter:
-            time.sleep(0.2)
-            automation_helper.keys("{enter}")
+            vks.append(win32con.VK_RETURN)
+        automation_helper.send_vk_batch(vks)
+
+        # One adaptive wait for the batch instead of a fixed sleep per key
+        if count:
+            misses = self._focus_wait_misses
+            if misses.get(previous_focus, 0) >= self.FOCUS_WAIT_MISS_LIMIT:
+                # Focus never moves away from this control - waiting for the UI thread to go idle is enough
+                automation_helper.wait_idle(timeout_ms=int(self.NANO_WAIT_MAX * 1000))
+            elif not automation_helper.wait_for_focus_change(previous_focus, timeout=self.NANO_WAIT_MAX):
+                misses[previous_focus] = misses.get(previous_focus, 0) + 1
+        time.sleep(end_delay)
         
+    @functools.cached_property
+    def window_info(self):
+        """Main window details, read on first use - most runs never need them"""
+        return self.automation_helper.get_window_info()
+    
     def get_window_info(self):
         """Get current window information"""
         return self.window_info
@@ -806,6 +902,9 @@ class BTTSelectionDialog:
     - Extensible design for adding more card types
     """
     
+    # Prompt file contents keyed by (path, mtime) - dropdown changes reload the same few files
+    _prompt_cache = {}
+    
     def __init__(self):
         self.root = None
         self.result = None
@@ -844,12 +943,18 @@ class BTTSelectionDialog:
                 return os.path.join(app_dir, relative_path)
             
             filepath = get_app_data_path(os.path.join('prompts', 'btt', filename))
-            if os.path.exists(filepath):
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    return f.read().strip()
-            else:
+            try:
+                st = os.stat(filepath)
+            except FileNotFoundError:
                 print(f"WARNING: Prompt file not found: {filepath}")
                 return ""
+            
+            # An edited file gets a new mtime, so it is read again
+            key = (filepath, st.st_mtime_ns)
+            if (content := self._prompt_cache.get(key)) is None:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    content = self._prompt_cache[key] = f.read().strip()
+            return content
         except Exception as e:
             print(f"ERROR: Error loading prompt file {filename}: {e}")
             return ""
@@ -974,10 +1079,58 @@ class BTTSelectionDialog:
             print(f"❌ Error showing selection dialog: {e}")
             return None
 
+@critical_exception_handler
+def _run_from_custom(btt_automation, pwin, config):
+    """START_FROM_CUSTOM: run the configured steps in the open questionnaire, then apply and export"""
+    if not (edit_window := ManualAutomationHelper(target_window_title=WindowTitle.EDIT_QUESTIONNAIRE.value)):
+        print("ERROR: No edit window found")
+        return False
+    qf = QuestionnaireFiller(edit_window)
+    qf.questionnaire_forms.values["testing_contact"] = True
+    qf.questionnaire_forms.values["testing_contactless"] = True
+    
+    # Use execution steps from loaded configuration
+    execution_steps = config.get('execution_steps', '')
+    if execution_steps:
+        print("Using execution steps from configuration file...")
+        qf.execute(execution_steps)
+    else:
+        print("WARNING: No execution steps found in configuration, using default behavior...")
+        qf.execute()
+        
+    # Get bottom 1/4 region to avoid false positives with similar buttons in middle of window
+    search_region = get_bottom_quarter_region(pwin.get_bbox())
+    click_apply_ok_button(pwin, search_region=search_region)
+    btt_automation.export_file_done()
+    return True
+
+
+@critical_exception_handler
+def _run_from_questionnaire(btt_automation, pwin, config):
+    """START_FROM_CLICK_START_TEST: open the questionnaire from Project Settings and fill it"""
+    if not (edit_window := start_questionnaire(pwin, questionnaire_window_title=WindowTitle.EDIT_QUESTIONNAIRE.value)):
+        print("❌ No edit window found")
+        return False
+    btt_automation.fill_questionnaire_v2(edit_window)
+    return True
+
+
+# Custom modes that start from an open Project Settings window
+_CUSTOM_MODE_HANDLERS = {
+    ExecutionMode.START_FROM_CUSTOM.value: _run_from_custom,
+    ExecutionMode.START_FROM_QUESTIONNAIRE.value: _run_from_questionnaire,
+}
+
+
 @critical_exception_handler
 def main():
     """Main execution function with critical exception handling"""
     
+    # Ctrl+C raises KeyboardInterrupt and SIGTERM SystemExit wherever the run is, even in the
+    # dialog or a blocking wait; either way the finally block below cleans up
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, _request_shutdown)
+    
     # Show selection dialog first
     logger.info("Starting BTT Automation Configuration...")
     print("Starting BTT Automation Configuration...")
@@ -1003,84 +1156,63 @@ def main():
     print(f"   Test Type Prompt Length: {len(config['test_type_prompt'])} chars")
     print(f"   Execution Steps Length: {len(config['execution_steps'])} chars")
     
-    # Create automation instance
-    logger.info("Creating BTT automation instance...")
-    print("Creating BTT automation instance...")
-    btt_automation = BrandTestToolAutomation()
-    
-    # Pass configuration to automation
-    logger.info("Setting automation configuration...")
-    print("Setting automation configuration...")
-    btt_automation.set_config(config)
-    
-    # Demonstrate how configuration is used
-    # btt_automation.demonstrate_config_usage()
-    
-    # Use the custom mode from dialog configuration
-    CUSTOM_MODE = config['custom_mode']
-    
-    if CUSTOM_MODE and CUSTOM_MODE != "":
-        
-        if CUSTOM_MODE == ExecutionMode.EXPORT_TEST.value:
-            print("Exporting test file...")
-            btt_automation.automation_helper._bring_to_focus()
-            time.sleep(1)
-            btt_automation.export_file_done()
-            exit(0)
-        
-        if not (pwin := ManualAutomationHelper(target_window_title=WindowTitle.PROJECT_SETTINGS.value, title_starts_with=True)):
-            print("ERROR: No project settings window found")
-            exit()
-        
-        if CUSTOM_MODE == ExecutionMode.START_FROM_CUSTOM.value:
-            if not (edit_window := ManualAutomationHelper(target_window_title=WindowTitle.EDIT_QUESTIONNAIRE.value)):
-                print("ERROR: No edit window found")
-                exit()
-            qf = QuestionnaireFiller(edit_window)
-            qf.questionnaire_forms.values["testing_contact"] = True
-            qf.questionnaire_forms.values["testing_contactless"] = True
-            
-            # Use execution steps from loaded configuration
-            execution_steps = config.get('execution_steps', '')
-            if execution_steps:
-                print("Using execution steps from configuration file...")
-                qf.execute(execution_steps)
-            else:
-                print("WARNING: No execution steps found in configuration, using default behavior...")
-                qf.execute()
-                
-            # Get bottom 1/4 region to avoid false positives with similar buttons in middle of window
-            from utils.common import get_bottom_quarter_region
-            search_region = get_bottom_quarter_region(pwin.get_bbox())
-            click_apply_ok_button(pwin, search_region=search_region)
-            btt_automation.export_file_done()
+    btt_automation = None
+    try:
+        # Create automation instance
+        logger.info("Creating BTT automation instance...")
+        print("Creating BTT automation instance...")
+        btt_automation = BrandTestToolAutomation()
+        
+        # Pass configuration to automation
+        logger.info("Setting automation configuration...")
+        print("Setting automation configuration...")
+        btt_automation.set_config(config)
+        
+        # Demonstrate how configuration is used
+        # btt_automation.demonstrate_config_usage()
+        
+        # Use the custom mode from dialog configuration
+        CUSTOM_MODE = config['custom_mode']
+        
+        if CUSTOM_MODE and CUSTOM_MODE != "":
             
+            if CUSTOM_MODE == ExecutionMode.EXPORT_TEST.value:
+                print("Exporting test file...")
+                btt_automation.export_file_done()
+                sys.exit(0)
             
+            if not (pwin := ManualAutomationHelper(target_window_title=WindowTitle.PROJECT_SETTINGS.value, title_starts_with=True)):
+                print("ERROR: No project settings window found")
+                sys.exit(1)
             
-        elif CUSTOM_MODE == ExecutionMode.START_FROM_QUESTIONNAIRE.value:
-            if not (edit_window := start_questionnaire(pwin, questionnaire_window_title=WindowTitle.EDIT_QUESTIONNAIRE.value)):
-                print("❌ No edit window found")
-                exit()
-            qf = QuestionnaireFiller(edit_window)
-            btt_automation.fill_questionnaire_v2(edit_window)
+            # Handlers return False on failure, or None if a critical exception was handled
+            if (handler := _CUSTOM_MODE_HANDLERS.get(CUSTOM_MODE)) and not handler(btt_automation, pwin, config):
+                sys.exit(1)
             
-        print("Custom Mode Execution completed.")
-        exit(0)
-    
-    # Regular automation flow with configuration
-    print("\n🚀 Starting regular automation with selected configuration...")
-    btt_automation.execute_all_steps()
-    
-    # at this stage the file is already done, so we can just export it
-    print("🚀 Exporting test file...")
-    btt_automation.export_file_done()
-    
-    btt_automation._cleanup_resources()
-    
-    from tkinter import messagebox
-    messagebox.showinfo("Success", "Process completed successfully!")
-    exit(0)
+            print("Custom Mode Execution completed.")
+            sys.exit(0)
+        
+        # Regular automation flow with configuration
+        print("\n🚀 Starting regular automation with selected configuration...")
+        # A step that fails returns False; a critical exception also sets the stop event
+        if not btt_automation.execute_all_steps():
+            sys.exit(1)
+        _exit_if_stopped()
+        
+        # at this stage the file is already done, so we can just export it
+        print("🚀 Exporting test file...")
+        btt_automation.export_file_done()
+        _exit_if_stopped()
+        
+        messagebox.showinfo("Success", "Process completed successfully!")
+        sys.exit(0)
+    finally:
+        # Runs on success, sys.exit, Ctrl+C and SIGTERM alike - the one place resources are released
+        if btt_automation is not None:
+            btt_automation._cleanup_resources()
 
 # Example usage
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    # main() itself hit a critical exception (already logged and cleaned up)
+    _exit_if_stopped()
\ No newline at end of file
@@ -6,6 +6,7 @@ Contains all standard form methods that can be inherited and customized by child
 import time
 import sys
 import os
+import functools
 
 
 
@@ -19,16 +20,26 @@ try:
 except ImportError:
     from helpers import select_countries
 
-from utils.common import click_apply_ok_button
+from utils.common import click_apply_ok_button, get_roi_region
 
 # Make image scanner import optional
 try:
-    from utils.image_scanner import scan_for_image
+    from utils.image_scanner import (scan_for_image, scan_for_image_pyramid, get_prefetch_scanner,
+                                     get_pinned_location, pin_image_location)
 except ImportError:
     print("⚠️ Warning: image_scanner not available (missing cv2 dependency)")
     def scan_for_image(*args, **kwargs):
         print("❌ scan_for_image not available - install opencv-python")
         return None
+    def scan_for_image_pyramid(*args, **kwargs):
+        print("❌ scan_for_image_pyramid not available - install opencv-python")
+        return None
+    def get_pinned_location(*args, **kwargs):
+        return None
+    def pin_image_location(*args, **kwargs):
+        return None
+    def get_prefetch_scanner():
+        return None
 
 
 class BaseQuestionnaireForms:
@@ -134,6 +145,22 @@ test_session_name: some test session name
         if not steps_text or not steps_text.strip():
             return []
         
+        # List arguments are cached as tuples; hand each caller its own lists
+        return [(method_name, [list(arg) if isinstance(arg, tuple) else arg for arg in args])
+                for method_name, args in self._compile_execution_steps(steps_text)]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _compile_execution_steps(steps_text):
+        """
+        Parse execution steps text once per distinct text.
+        
+        Args:
+            steps_text (str): Execution steps text
+            
+        Returns:
+            tuple: Tuples of (method_name, args) with list arguments stored as tuples
+        """
         parsed_steps = []
         
         for line in steps_text.strip().split('\n'):
@@ -154,9 +181,9 @@ test_session_name: some test session name
             if args_str:
                 # Check if the entire argument string is an array format
                 if args_str.startswith('[') and args_str.endswith(']'):
-                    # Parse as array: [item1, item2, item3] -> ["item1", "item2", "item3"]
+                    # Parse as array: [item1, item2, item3] -> ("item1", "item2", "item3")
                     list_items = args_str[1:-1].split(',')
-                    array_items = [item.strip() for item in list_items if item.strip()]
+                    array_items = tuple(item.strip() for item in list_items if item.strip())
                     args.append(array_items)
                 else:
                     # Parse as comma-separated parameters
@@ -172,10 +199,10 @@ test_session_name: some test session name
                         else:
                             args.append(arg)
             
-            parsed_steps.append((method_name, args))
+            parsed_steps.append((method_name, tuple(args)))
+        
+        return tuple(parsed_steps)
         
-        return parsed_steps
-    
     def execute(self, steps_text=None):
         """
         Execute the defined execution steps.
@@ -238,15 +265,13 @@ test_session_name: some test session name
         """
         Processor name - single text input.
         """
-        sequence = f"__0.2,tab,tab,{processor_name},tab,space"
-        return self.qf.parse_and_execute_sequence(sequence)
+        return self.__fill_text_input_list_forms([processor_name])
     
     def user_tester_information(self, name="Tester", email="Tester@thoughtfocus.com"):
         """
         User/tester information - 2 text inputs, one name and one email.
         """
-        sequence = f"__0.2,tab,tab,{name},tab,tab,{email},tab,space"
-        return self.qf.parse_and_execute_sequence(sequence)
+        return self.__fill_text_input_list_forms([name, email])
     
     def testing_details(self, check_first=True, check_second=True):
         """
@@ -324,7 +349,9 @@ test_session_name: some test session name
         """
         Check for use suggested value button.
         """
-        return scan_for_image("use-suggested-value-btn.png", self.current_window.get_bbox(), threshold=0.8)
+        # get_bbox() is (left, top, right, bottom); the scanner takes (x, y, width, height)
+        _, window_region = get_roi_region(self.current_window.get_bbox(), frac_x=(0, 1.0), frac_y=(0, 1.0))
+        return scan_for_image_pyramid("use-suggested-value-btn.png", window_region, threshold=0.8, levels=2)
     
     def terminal_atm_information(self, terminal_name="terminal name", model_name="model name", version_info="version info"):
         """
@@ -371,34 +398,28 @@ test_session_name: some test session name
         """
         Contactless ATM Information - 2 text inputs, one extra button after each input.
         """
-        sequence = f"__0.2,tab,tab,{atm1_name},tab,tab,{atm2_name},tab,space"
-        return self.qf.parse_and_execute_sequence(sequence)
+        return self.__fill_text_input_list_forms([atm1_name, atm2_name])
     
     
     def __fill_text_input_list_forms(self, values:list[str], last_button_tab_count:int = 0, go_next:bool = True, tabs_between_inputs:int = 2):
         """
         Fill the test input list forms with the given values.
+        All values and the tabs between them are sent as one SendInput batch
+        instead of one DSL command (and sleep) per key.
         """
-        sequence = "__0.2,tab,tab"
+        if not self.qf.parse_and_execute_sequence("__0.2,tab,tab"):
+            return False
+        
         if len(values) == 0:
             # we are skipping this directly without any input
-            sequence += ",tab" * last_button_tab_count
-        else:        
-            for i in range(len(values)):
-                sequence = self.__set_text_input_value(sequence, values[i], last_button_tab_count if i == len(values)-1 else tabs_between_inputs)
+            values = [""]
+        
+        if not self.current_window.fill_fields(values, tabs_between=tabs_between_inputs, trailing_tabs=last_button_tab_count):
+            return False
+        
         if go_next:
-            sequence += ",tab,space"
-            
-        print("fill_text_input_list_forms: sequence before execution: ", sequence)
-        return self.qf.parse_and_execute_sequence(sequence)
-    
-    def __set_text_input_value(self, sequence: str, value: str, followed_by_tab_count: int = 0):
-        """
-        Set the text input value to the given value.
-        """
-        sequence += f",{value}"
-        sequence += ",{tab}" * followed_by_tab_count
-        return sequence
+            return self.qf.parse_and_execute_sequence("tab,space")
+        return True
     
     def __fill_radio_list_forms(self, values:list[bool], last_button_tab_count:int = 0, go_next:bool = True):
         """
@@ -503,14 +524,37 @@ test_session_name: some test session name
         Comment box - single text input.
         It means skip it if comment is None
         """
-        return self.__fill_text_input_list_forms(["" if comment is None else comment])
+        success = self.__fill_text_input_list_forms(["" if comment is None else comment])
+        
+        # The confirm screen comes next - start looking for its button while it loads
+        if success and (prefetch_scanner := get_prefetch_scanner()):
+            prefetch_scanner.prefetch("confirm-information-btn.png", self.__confirm_button_region(),
+                                      threshold=0.8, method="SQDIFF")
+        return success
+    
+    def __confirm_button_region(self):
+        """
+        The confirm button is in the lower-right part of the page.
+        """
+        _, button_region = get_roi_region(self.current_window.get_bbox(), frac_x=(0.4, 1.0), frac_y=(0.4, 1.0))
+        return button_region
     
     def confirm_final_information(self):
         """
         Final information screen - confirm button (special handling required).
         """
-        time.sleep(0.2)
-        confirm_information_button_location = scan_for_image("confirm-information-btn.png", self.current_window.get_bbox(), threshold=0.8)
+        self.current_window.wait_idle(timeout_ms=200)
+        button_region = self.__confirm_button_region()
+        # The button sits at the same spot of a same-size window, so check where it was last time first
+        confirm_information_button_location = get_pinned_location("confirm-information-btn.png", button_region, threshold=0.8)
+        if not confirm_information_button_location:
+            # Use the location prefetched after the comment box, otherwise scan now
+            prefetch_scanner = get_prefetch_scanner()
+            confirm_information_button_location = prefetch_scanner.get("confirm-information-btn.png") if prefetch_scanner else None
+            if not confirm_information_button_location:
+                confirm_information_button_location = scan_for_image_pyramid("confirm-information-btn.png", button_region, threshold=0.8, method="SQDIFF")
+            if confirm_information_button_location:
+                pin_image_location("confirm-information-btn.png", button_region, confirm_information_button_location)
         if confirm_information_button_location:
             self.current_window.click(confirm_information_button_location)
             return True
@@ -1,7 +1,9 @@
-import time
+from utils.image_scanner import ImageScanner, wait_for_image
+from utils.windows_automation import ManualAutomationHelper, get_window_watcher
+from utils.common import get_roi_region
 
-from utils.image_scanner import scan_for_image
-from utils.windows_automation import ManualAutomationHelper
+# Expected bounding box of the questionnaire window - BoundingRectangle: {l:71 t:65 r:1270 b:707}
+QUESTIONNAIRE_BBOX = (71, 65, 1270, 707)
 
 def start_questionnaire(automator, questionnaire_window_title: str):
     """
@@ -10,26 +12,29 @@ def start_questionnaire(automator, questionnaire_window_title: str):
     # What we should see now is a tabbed UI and first tab is highlighted
     # we are looking for a 2nd tab, we ensure we click the right tab by scanning for the unfocussed tab image
     # Lets scan for image for starting button
-    if not (btn_start := scan_for_image("start-tse-test-session.png", automator.get_bbox(), threshold=0.8)):
+    # The parent window is not moved by these clicks, so work out the search region once for both scans.
+    # The buttons live in the right panel - the left 30% is the tree
+    _, panel_region = get_roi_region(automator.get_bbox(), frac_x=(0.3, 1.0), frac_y=(0, 1.0))
+    # The right panel may still be populating, so keep scanning until the button shows up
+    if not (btn_start := wait_for_image("start-tse-test-session.png", panel_region, timeout=1.0, interval=0.1, pyramid_levels=2)):
         print("❌ No start button found")
         return None
     automator.click(btn_start)
-    time.sleep(1)
     
     # this adds a edit button into the UI, we need to click on it
-    # we scan for the edit button image
-    if not (btn_edit := scan_for_image("edit-tse-test-session.png", automator.get_bbox(), threshold=0.8)):
+    # we scan for the edit button image until it appears
+    if not (btn_edit := wait_for_image("edit-tse-test-session.png", panel_region, timeout=1.0, interval=0.1, pyramid_levels=2)):
         print("❌ No edit button found")
         return None
     automator.click(btn_edit)
-    time.sleep(2)
     
-    # Now we are in the Edit EMVCo L3 Test Session - Questionnaire window
-    if not (edit_window := ManualAutomationHelper(target_window_title=questionnaire_window_title)):
+    # Now we are in the Edit EMVCo L3 Test Session - Questionnaire window, the watcher reports it as soon as it opens
+    if not (edit_window_hwnd := get_window_watcher().wait_for_window(questionnaire_window_title, timeout=2.0)):
         print(f"❌ No {questionnaire_window_title} window found")
         return None
-    # Expected bounding box is BoundingRectangle:	{l:71 t:65 r:1270 b:707}
-    edit_window.setup_window(bbox=(71, 65, 1270, 707))
+    edit_window = ManualAutomationHelper(window_handle=edit_window_hwnd)
+    # The window is placed at a known position, so reuse that bbox instead of re-querying it
+    edit_window.setup_window(bbox=QUESTIONNAIRE_BBOX)
     
      # Start the questionairres window
     # if not (edit_emvco_l3_test_session_window := start_questionnaire(current_parent_window, "Edit EMVCo L3 Test Session - Questionnaire")):
@@ -37,10 +42,18 @@ def start_questionnaire(automator, questionnaire_window_title: str):
     
     # # What we should see now is a tabbed UI and first tab is highlighted
     # # we are looking for a 2nd tab, we ensure we click the right tab by scanning for the unfocussed tab image
-    edit_answers_tab = scan_for_image("edit-answers.png", edit_window.get_bbox(), threshold=0.8)
+    # The tabs sit in the top-left corner, so only that part of the window is scanned
+    _, tabs_region = get_roi_region(QUESTIONNAIRE_BBOX, frac_x=(0, 0.4), frac_y=(0, 0.3))
+    # A window that has just opened may not have drawn its tabs yet, so keep scanning until the tab shows up
+    edit_answers_tab = wait_for_image("edit-answers.png", tabs_region, timeout=2.0, interval=0.1,
+                                      method="SQDIFF", pyramid_levels=3)
     if edit_answers_tab:
+        # The tab strip itself takes focus on the click, so wait for the form area below the tabs to redraw
+        _, form_region = get_roi_region(QUESTIONNAIRE_BBOX, frac_x=(0, 1.0), frac_y=(0.3, 1.0))
+        scanner = ImageScanner()
+        form_digest = scanner.region_digest(form_region)
         edit_window.click(edit_answers_tab)
-        time.sleep(2)
+        scanner.wait_region_change(form_region, form_digest, interval=0.05, timeout=2.0)
     else:
         print("❌ No edit answers button found")
         return False
@@ -141,12 +154,16 @@ def select_countries(automation_helper, country_list=None):
             # Only use letter navigation if we're in a different letter group
             if current_letter != target_letter:
                 print(f"🔤 Different letter groups, typing '{target_letter}' to jump to that section")
+                region = automation_helper.get_focused_region()
+                before = scanner.region_digest(region) if region else None
                 success = automation_helper.keys(target_letter)
                 if not success:
                     print(f"❌ Failed to type letter '{target_letter}'")
                     return current_pos, False
                 
-                time.sleep(0.2)  # Allow UI to respond
+                # Allow UI to respond - the selection jump shows up in the list
+                if region:
+                    scanner.wait_region_change(region, before, timeout=0.2)
                 
                 # After typing letter, we should be at the first country with that letter
                 first_with_letter_pos, first_with_letter = get_first_country_with_letter(target_letter, available_countries)
@@ -163,25 +180,13 @@ def select_countries(automation_helper, country_list=None):
             steps_needed = target_index - current_pos
             print(f"🔢 Need to move {steps_needed} steps ({'down' if steps_needed > 0 else 'up'})")
             
-            if steps_needed > 0:
-                # Move down
-                for step in range(abs(steps_needed)):
-                    success = automation_helper.keys("{down}")
-                    if not success:
-                        print(f"❌ Failed to move down at step {step+1}")
-                        return current_pos, False
-                    current_pos += 1
-                    time.sleep(0.02)
-                    
-            elif steps_needed < 0:
-                # Move up
-                for step in range(abs(steps_needed)):
-                    success = automation_helper.keys("{up}")
-                    if not success:
-                        print(f"❌ Failed to move up at step {step+1}")
-                        return current_pos, False
-                    current_pos -= 1
-                    time.sleep(0.02)
+            if steps_needed:
+                # Send the whole run of arrow keys as one input batch
+                direction = "{down}" if steps_needed > 0 else "{up}"
+                if not automation_helper.keys_batch([direction] * abs(steps_needed)):
+                    print(f"❌ Failed to move {direction[1:-1]} {abs(steps_needed)} steps")
+                    return current_pos, False
+                current_pos += steps_needed
             
             # We should now be at the target position
             final_country = available_countries[current_pos]
@@ -196,18 +201,13 @@ def select_countries(automation_helper, country_list=None):
                 return current_pos, False
             
             steps_needed = target_index - current_pos
-            if steps_needed > 0:
-                for i in range(abs(steps_needed)):
-                    automation_helper.keys("{down}")
-                    time.sleep(0.05)
-            elif steps_needed < 0:
-                for i in range(abs(steps_needed)):
-                    automation_helper.keys("{up}")
-                    time.sleep(0.05)
+            if steps_needed:
+                automation_helper.keys_batch(["{down}" if steps_needed > 0 else "{up}"] * abs(steps_needed))
             
             return target_index, True
         
         # Start selection process
+        scanner = ImageScanner()
         available_countries = all_countries.copy()  # Track remaining countries
         current_position = 0  # Start at first country (Afghanistan)
         selected_count = 0
@@ -230,13 +230,18 @@ def select_countries(automation_helper, country_list=None):
             
             # Select the country
             print(f"✅ Selecting '{target_country}' at position {current_position}")
+            region = automation_helper.get_focused_region()
+            before = scanner.region_digest(region) if region else None
             success = automation_helper.keys("{space}")
             if not success:
                 print(f"❌ Failed to select '{target_country}'")
                 return False
             
             print(f"⏳ Waiting for UI to update after selection...")
-            time.sleep(0.8)  # Give UI time to update - remove item and adjust cursor position
+            # Give UI time to update - remove item and adjust cursor position. Continues once the list has
+            # visibly changed and settled; 0.8 s stays the cap
+            if region:
+                scanner.wait_region_change(region, before, timeout=0.8)
             selected_count += 1
             
             # After selection: country is removed and cursor moves to position - 1
@@ -1,7 +1,9 @@
 import time
 import re
+import functools
 from forms import BaseQuestionnaireForms, DefaultQuestionnaireForms
-from utils.image_scanner import scan_for_image
+from utils.image_scanner import ImageScanner, scan_for_image
+from utils.windows_automation import get_focused_hwnd
 
 
 class QuestionnaireFiller:
@@ -9,7 +11,7 @@ class QuestionnaireFiller:
     A modular class for executing automation sequences using simple text syntax.
     
     Supported syntax:
-    - __0.2 : Sleep for 0.2 seconds
+    - __0.2 : Sleep for 0.2 seconds (at the start of a sequence: wait up to 0.2 seconds for the new page)
     - tab : Press tab key
     - space : Press space key
     - enter : Press enter key
@@ -23,6 +25,12 @@ class QuestionnaireFiller:
     Example sequence: "__0.2,tab,tab,Fiserv,tab,space,(img:oda-screen.png,tab)"
     """
     
+    # Text at least this long is pasted through the clipboard rather than typed
+    PASTE_MIN_LENGTH = 4
+    
+    # Plain key commands; consecutive ones are sent together as one input batch
+    KEY_COMMANDS = frozenset(['tab', 'space', 'enter', 'down', 'up', 'left', 'right'])
+    
     def __init__(self, automation_helper, forms_class=None):
         """
         Initialize the questionnaire filler with an automation helper and forms class.
@@ -44,6 +52,7 @@ class QuestionnaireFiller:
         
         # Instantiate the forms class
         self.questionnaire_forms = forms_class(self.automation_helper, self)
+        self._scanner = ImageScanner()
     
     def execute(self, steps_text=None):
         """
@@ -68,16 +77,21 @@ class QuestionnaireFiller:
             bool: True if successful, False otherwise
         """
         try:
-            # Split by comma but preserve content inside parentheses
-            commands = self._smart_split_sequence(sequence_text)
-            
-            for command in commands:
-                if not command:
+            for step in self._compile_sequence(sequence_text):
+                # Page-start settle time: continue as soon as the new page is showing
+                if isinstance(step, float):
+                    self._wait_for_page(step)
+                    continue
+                
+                # Runs of plain keys were grouped when the sequence was compiled
+                if isinstance(step, tuple):
+                    if not self._flush_keys(list(step)):
+                        return False
                     continue
                     
-                success = self._execute_command(command)
+                success = self._execute_command(step)
                 if not success:
-                    print(f"❌ Failed to execute command: {command}")
+                    print(f"❌ Failed to execute command: {step}")
                     return False
                     
             return True
@@ -86,7 +100,95 @@ class QuestionnaireFiller:
             print(f"❌ Error executing sequence: {e}")
             return False
     
-    def _smart_split_sequence(self, sequence_text):
+    def _wait_for_page(self, timeout):
+        """
+        Wait for the page opened by the previous step, at most the sequence's settle time.
+        A new page moves the focus to one of its own controls; after that the wait also lets the
+        window finish drawing. Without a focus change (including a page that was already showing
+        when the wait started) the full settle time is waited, as before.
+        
+        Args:
+            timeout (float): Settle time from the "__X" step (seconds)
+        """
+        # Compared against the focus now, not where an earlier sequence left it - the page may
+        # have been left by a click or a fill_fields batch since then
+        previous_focus = get_focused_hwnd(self.automation_helper.hwnd)
+        deadline = time.time() + timeout
+        if self.automation_helper.wait_for_focus_change(previous_focus, timeout=timeout):
+            left, top, right, bottom = self.automation_helper.get_bbox()
+            self._scanner.wait_region_stable((left, top, right - left, bottom - top),
+                                             timeout=max(0.0, deadline - time.time()))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_sequence(sequence_text):
+        """
+        Turn a sequence into its execution plan once per distinct sequence text.
+        
+        Args:
+            sequence_text (str): Comma-separated sequence of commands
+            
+        Returns:
+            tuple: Steps in order - a tuple of keys() tokens for each run of plain key
+                commands (sent as one batch), a float for the leading settle wait (a wait
+                for the new page capped at that many seconds), or the command string for anything else
+        """
+        plan = []
+        pending_keys = []
+        commands = QuestionnaireFiller._split_sequence(sequence_text)
+        # Pages start with "__0.2" to let the previous page finish; that is a wait for the
+        # new page to show, not a fixed delay, so it becomes one bounded wait for the page
+        if commands and commands[0].startswith('__'):
+            try:
+                plan.append(float(commands[0][2:]))
+                commands = commands[1:]
+            except ValueError:
+                pass
+        for command in commands:
+            key_token = QuestionnaireFiller._key_token(command)
+            if key_token:
+                pending_keys.append(key_token)
+                continue
+            # Anything else (text, waits, image checks) must see the keys already processed
+            if pending_keys:
+                plan.append(tuple(pending_keys))
+                pending_keys = []
+            plan.append(command)
+        if pending_keys:
+            plan.append(tuple(pending_keys))
+        return tuple(plan)
+    
+    @staticmethod
+    def _key_token(command):
+        """
+        Get the keys() token for a plain key command ("tab", "{space}", ...), or None for other commands.
+        """
+        if command.startswith('{') and command.endswith('}'):
+            command = command[1:-1]
+        key = command.strip().lower()
+        return f"{{{key}}}" if key in QuestionnaireFiller.KEY_COMMANDS else None
+    
+    def _flush_keys(self, pending_keys):
+        """
+        Send the collected key commands as one batch and wait until the window has handled them.
+        
+        Args:
+            pending_keys (list): keys() tokens of one compiled key step
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not pending_keys:
+            return True
+        success = self.automation_helper.keys_batch(pending_keys)
+        if not success:
+            print(f"❌ Failed to send keys: {pending_keys}")
+        # At most the old per-key delay
+        self.automation_helper.wait_idle(timeout_ms=100)
+        return success
+    
+    @staticmethod
+    def _split_sequence(sequence_text):
         """
         Split sequence by commas but preserve content inside parentheses.
         
@@ -94,7 +196,7 @@ class QuestionnaireFiller:
             sequence_text (str): Comma-separated sequence
             
         Returns:
-            list: List of commands with parentheses content preserved
+            tuple: Commands with parentheses content preserved
         """
         commands = []
         current_command = ""
@@ -119,7 +221,7 @@ class QuestionnaireFiller:
         if current_command.strip():
             commands.append(current_command.strip())
         
-        return commands
+        return tuple(commands)
     
     def _execute_command(self, command):
         """
@@ -246,7 +348,11 @@ class QuestionnaireFiller:
             bool: True if successful, False otherwise
         """
         try:
-            self.automation_helper.type(text)
+            # Longer strings are pasted in one go instead of typed character by character
+            if len(text) >= self.PASTE_MIN_LENGTH:
+                self.automation_helper.paste_text(text)
+            else:
+                self.automation_helper.type(text)
             time.sleep(0.1)  # Small delay after typing
             return True
             
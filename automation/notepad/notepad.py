@@ -3,7 +3,6 @@
 
 import sys
 import os
-import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from utils import (
@@ -31,24 +30,10 @@ class NotepadAutomation:
                 print("❌ No automation helper available. Run bring_to_focus() first.")
                 return False
             
-            # Parse the navigation path
-            steps = NavigationParser.parse_navigation_path(navigation_path)
-            
-            if not steps:
-                print("❌ Failed to parse navigation path")
+            if not NavigationParser.navigate(navigation_path, self.automation_helper):
+                print("❌ Failed to execute navigation steps")
                 return False
             
-            print(f"📝 Parsed {len(steps)} navigation steps")
-            
-            # Execute each step using Windows API
-            for i, step in enumerate(steps, 1):
-                print(f"  Step {i}/{len(steps)}: {step['description']}")
-                success = NavigationParser.execute_step_windows(step, self.automation_helper)
-                if not success:
-                    print(f"❌ Failed to execute step {i}")
-                    return False
-                time.sleep(0.2)  # Small delay between steps
-            
             print("✅ All navigation steps executed successfully!")
             return True
             
@@ -1,4 +1,5 @@
 import os
+import operator
 from utils.windows_automation import ManualAutomationHelper
 from utils.image_scanner import scan_for_all_occurrences
 from utils.graphics import ScreenOverlay, visualize_image_search
@@ -82,12 +83,11 @@ def collapse_tree_items(automation_helper=None):
             enabled=DEBUG_VISUALIZATION
         )
         
-        # Sort results by Y coordinate (bottom to top)
+        # Only the bottommost item is clicked, so pick it in one pass instead of sorting
         # results format: [(x, y), ...]
-        sorted_results = sorted(results, key=lambda x: x[1], reverse=True)
+        center_x, center_y = max(results, key=operator.itemgetter(1))
         
         # Click the bottommost expanded item
-        center_x, center_y = sorted_results[0]
         print(f"🖱️  Clicking bottommost expanded item at ({center_x}, {center_y})")
         
         # Click the minus icon to collapse
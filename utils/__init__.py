@@ -1,12 +1,15 @@
 # Utils package for sequence recorder 
 from .image_scanner import (
-    ImageScanner, scan_for_image, scan_for_multiple_images, scan_for_all_occurrences,
+    ImageScanner, PrefetchScanner, get_prefetch_scanner, scan_for_image, scan_for_image_pyramid, wait_for_image, preload_templates,
+    get_pinned_location, pin_image_location, scan_for_multiple_images, scan_for_all_occurrences,
     scan_image_with_bbox, create_advanced_scan_dialog
 )
 from .windows_automation import (
     ManualAutomationHelper, list_all_windows, find_windows_by_title, 
-    find_windows_by_title_starts_with, get_window_info
+    find_windows_by_title_starts_with, get_window_info, get_focused_hwnd, wait_for,
+    WindowEventWatcher, get_window_watcher, stop_window_watcher
 )
+from .win32_find import find_window_by_title
 from .navigation_parser import NavigationParser
 from .common import show_modal_input_dialog, show_result_dialog
 from .sequence_player import (
@@ -18,4 +21,21 @@ from .graphics import (
     clear_all_overlays, hide_overlays, show_overlays, destroy_overlays
 )
 from .text_reader import TextReader, text_reader
-from .ai_service import AIService, quick_query
\ No newline at end of file
+
+
+# ai_service pulls in langchain/openai at import time, which the automation scripts never use;
+# load it on first attribute access instead (PEP 562)
+_LAZY_ATTRS = {
+    "AIService": ".ai_service",
+    "quick_query": ".ai_service",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        import importlib
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -212,6 +212,36 @@ def get_bottom_quarter_region(bbox):
     return search_bbox, search_bounding_box
 
 
+def get_roi_region(bbox, frac_x=(0, 0.4), frac_y=(0, 0.3)):
+    """
+    Calculate a sub-region of a window bounding box from width/height fractions.
+    Scanning only where a control can appear keeps template matching cheap.
+
+    Args:
+        bbox: Window bounding box as (left, top, right, bottom)
+        frac_x: (start, end) fractions of the width, e.g. (0, 0.4) for the left 40%
+        frac_y: (start, end) fractions of the height, e.g. (0, 0.3) for the top 30%
+
+    Returns:
+        tuple: (search_bbox, search_bounding_box) where:
+            - search_bbox: (left, top, right, bottom) of the sub-region
+            - search_bounding_box: (x, y, width, height) for image scanning
+    """
+    left, top, right, bottom = bbox
+    width = right - left
+    height = bottom - top
+
+    roi_left = left + int(width * frac_x[0])
+    roi_right = left + int(width * frac_x[1])
+    roi_top = top + int(height * frac_y[0])
+    roi_bottom = top + int(height * frac_y[1])
+
+    search_bbox = (roi_left, roi_top, roi_right, roi_bottom)
+    search_bounding_box = (roi_left, roi_top, roi_right - roi_left, roi_bottom - roi_top)
+
+    return search_bbox, search_bounding_box
+
+
 def click_apply_ok_button(current_window=None, window_title: str=None, search_region=None):
     """
     Click on the Apply OK button using centralized animated image detection with debug visualization.
@@ -245,23 +275,17 @@ def click_apply_ok_button(current_window=None, window_title: str=None, search_re
         print(f"🔍 Searching entire window: {search_bbox}")
     
     # Use the centralized image scanner with animated_image=True
-    from utils.image_scanner import scan_for_image
-    
-    # Find Apply button using animated search
-    apply_location = scan_for_image(
-        "apply-btn-normal.png", 
-        search_bounding_box,
-        threshold=0.8, 
-        animated_image=True
-    )
+    from utils.image_scanner import scan_for_multiple_images
     
-    # Find OK button using animated search
-    ok_location = scan_for_image(
-        "ok-btn-normal.png", 
+    # Find Apply and OK buttons in one animated search - both are matched against the same captures
+    button_locations = scan_for_multiple_images(
+        ["apply-btn-normal.png", "ok-btn-normal.png"],
         search_bounding_box,
-        threshold=0.8, 
+        threshold=0.8,
         animated_image=True
     )
+    apply_location = button_locations.get("apply-btn-normal.png")
+    ok_location = button_locations.get("ok-btn-normal.png")
     
     # Show debug visualization using custom button visualization (works without click interference)
     if apply_location and ok_location:
@@ -6,7 +6,60 @@ Provides functions to draw visual indicators on screen for debugging image searc
 import tkinter as tk
 from typing import Tuple, Optional, List
 import time
+import queue
 import threading
+import logging
+
+# "Debug:" lines for disabled overlays go here - they are emitted by every background scan,
+# so they are only formatted when debug logging is switched on
+logger = logging.getLogger(__name__)
+
+
+class CanvasItemPool:
+    """
+    Reuses canvas items instead of deleting and recreating them.
+    Released items are hidden and handed out again (moved and restyled) by the next take(),
+    so repeated debug drawings don't keep allocating new Tk items.
+    """
+    
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        self._free = {}  # kind -> list of hidden item IDs
+        self._used = {}  # item ID -> kind
+    
+    def take(self, kind: str, coords: tuple, **options) -> int:
+        """
+        Get a visible item of the given kind ('rectangle', 'oval' or 'text')
+        
+        Args:
+            kind: Canvas item type
+            coords: Item coordinates, as for canvas.create_<kind>
+            **options: Item options (outline, fill, width, text, ...)
+            
+        Returns:
+            int: Canvas item ID
+        """
+        free = self._free.get(kind)
+        if free:
+            item_id = free.pop()
+            self.canvas.coords(item_id, *coords)
+            self.canvas.itemconfigure(item_id, state='normal', **options)
+        else:
+            item_id = getattr(self.canvas, f"create_{kind}")(*coords, **options)
+        self._used[item_id] = kind
+        return item_id
+    
+    def release(self, item_ids):
+        """Hide items and return them to the pool"""
+        for item_id in item_ids:
+            kind = self._used.pop(item_id, None)
+            if kind is not None:
+                self.canvas.itemconfigure(item_id, state='hidden')
+                self._free.setdefault(kind, []).append(item_id)
+    
+    def release_all(self):
+        """Hide every item handed out by the pool"""
+        self.release(list(self._used))
 
 
 class ScreenOverlay:
@@ -15,6 +68,7 @@ class ScreenOverlay:
     def __init__(self):
         self.root = None
         self.canvas = None
+        self.pool = None
         self.overlay_items = []
         self.is_visible = False
     
@@ -50,6 +104,7 @@ class ScreenOverlay:
             highlightthickness=0
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.pool = CanvasItemPool(self.canvas)
         
         # Bind escape key to close overlay
         self.root.bind('<Escape>', lambda e: self.hide_overlay())
@@ -80,8 +135,8 @@ class ScreenOverlay:
             self.create_overlay()
         
         # Draw rectangle border
-        rect_id = self.canvas.create_rectangle(
-            x1, y1, x2, y2,
+        rect_id = self.pool.take(
+            'rectangle', (x1, y1, x2, y2),
             outline=color,
             width=width,
             fill=""  # Transparent fill
@@ -91,8 +146,8 @@ class ScreenOverlay:
         label_id = None
         if label:
             # Position label at top-left of rectangle
-            label_id = self.canvas.create_text(
-                x1 + 5, y1 + 5,
+            label_id = self.pool.take(
+                'text', (x1 + 5, y1 + 5),
                 text=label,
                 fill=color,
                 font=("Arial", 12, "bold"),
@@ -135,9 +190,8 @@ class ScreenOverlay:
         
         # Draw circle
         half_size = size // 2
-        circle_id = self.canvas.create_oval(
-            x - half_size, y - half_size,
-            x + half_size, y + half_size,
+        circle_id = self.pool.take(
+            'oval', (x - half_size, y - half_size, x + half_size, y + half_size),
             outline=color,
             fill=color,
             width=2
@@ -146,8 +200,8 @@ class ScreenOverlay:
         # Add label if provided
         label_id = None
         if label:
-            label_id = self.canvas.create_text(
-                x + half_size + 5, y,
+            label_id = self.pool.take(
+                'text', (x + half_size + 5, y),
                 text=label,
                 fill=color,
                 font=("Arial", 10, "bold"),
@@ -168,9 +222,9 @@ class ScreenOverlay:
         return circle_id
     
     def clear_overlay(self):
-        """Clear all drawn items from the overlay"""
-        if self.canvas:
-            self.canvas.delete("all")
+        """Clear all drawn items from the overlay (the items are kept for reuse)"""
+        if self.pool:
+            self.pool.release_all()
         self.overlay_items.clear()
     
     def hide_overlay(self):
@@ -194,6 +248,7 @@ class ScreenOverlay:
             self.root.destroy()
             self.root = None
             self.canvas = None
+            self.pool = None
             self.overlay_items.clear()
             self.is_visible = False
     
@@ -207,8 +262,87 @@ class ScreenOverlay:
         threading.Thread(target=hide_delayed, daemon=True).start()
 
 
+class AsyncDebugOverlay:
+    """
+    Debug overlay that draws on its own thread.
+    show() only queues the drawing, and items are removed with a Tk timer,
+    so the caller never waits for the overlay to be displayed or hidden.
+    """
+    
+    POLL_MS = 50
+    
+    def __init__(self):
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def show(self, search_region: Tuple[int, int, int, int],
+             found_locations: List[Tuple[int, int]] = None,
+             target_location: Tuple[int, int] = None,
+             duration: float = 3.0):
+        """
+        Queue a search region (green), found locations (red) and target (yellow) for display
+        
+        Args:
+            search_region: (x1, y1, x2, y2) of the searched area
+            found_locations: List of (x, y) matches
+            target_location: (x, y) of the match that will be clicked
+            duration: Seconds to keep the drawing on screen
+        """
+        self._requests.put((search_region, found_locations, target_location, duration))
+    
+    def _run(self):
+        # The Tk root lives on this thread only - tkinter objects must not be shared across threads
+        root = tk.Tk()
+        root.attributes('-fullscreen', True)
+        root.attributes('-topmost', True)
+        root.overrideredirect(True)
+        try:
+            root.wm_attributes('-transparentcolor', 'black')
+        except tk.TclError:
+            pass
+        canvas = tk.Canvas(root, bg='black', highlightthickness=0)
+        canvas.pack(fill=tk.BOTH, expand=True)
+        pool = CanvasItemPool(canvas)
+        # Items and hide timer of the drawing on screen; a newer request replaces it
+        shown = {'items': [], 'timer': None}
+        
+        def hide():
+            pool.release(shown['items'])
+            shown['items'] = []
+            shown['timer'] = None
+        
+        def poll():
+            # Only the newest queued request is still relevant - older ones would be replaced right away
+            request = None
+            while True:
+                try:
+                    request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+            if request is not None:
+                search_region, found_locations, target_location, duration = request
+                if shown['timer'] is not None:
+                    root.after_cancel(shown['timer'])
+                hide()
+                items = [pool.take('rectangle', tuple(search_region), outline='#00FF00', width=3, fill='')]
+                for x, y in found_locations or []:
+                    items.append(pool.take('oval', (x - 15, y - 15, x + 15, y + 15), outline='#FF0000', width=3, fill=''))
+                if target_location:
+                    x, y = target_location
+                    items.append(pool.take('oval', (x - 25, y - 25, x + 25, y + 25), outline='#FFFF00', width=5, fill=''))
+                shown['items'] = items
+                shown['timer'] = root.after(int(duration * 1000), hide)
+            root.after(self.POLL_MS, poll)
+        
+        root.after(self.POLL_MS, poll)
+        root.mainloop()
+
+
 # Global overlay instance
 _global_overlay = None
+_async_overlay = None
+_async_overlay_lock = threading.Lock()
 
 def get_overlay() -> ScreenOverlay:
     """Get the global overlay instance"""
@@ -218,6 +352,17 @@ def get_overlay() -> ScreenOverlay:
     return _global_overlay
 
 
+def get_async_overlay() -> AsyncDebugOverlay:
+    """Get the global asynchronous debug overlay instance"""
+    global _async_overlay
+    if _async_overlay is None:
+        # Callers on the scan pool and the main thread must not start two overlay threads
+        with _async_overlay_lock:
+            if _async_overlay is None:
+                _async_overlay = AsyncDebugOverlay()
+    return _async_overlay
+
+
 # Convenience functions
 def draw_search_region(x1: int, y1: int, x2: int, y2: int, 
                       label: str = "Search Region", 
@@ -241,7 +386,7 @@ def draw_search_region(x1: int, y1: int, x2: int, y2: int,
         int: Item ID for the drawn rectangle (or 0 if disabled)
     """
     if not enabled:
-        print(f"🔍 Debug: Search region {label} at ({x1}, {y1}) to ({x2}, {y2})")
+        logger.debug("🔍 Debug: Search region %s at (%s, %s) to (%s, %s)", label, x1, y1, x2, y2)
         return 0
     
     overlay = get_overlay()
@@ -272,7 +417,7 @@ def draw_found_locations(locations: List[Tuple[int, int]],
         List[int]: Item IDs for the drawn points (or empty list if disabled)
     """
     if not enabled:
-        print(f"🎯 Debug: Found {len(locations)} locations: {locations}")
+        logger.debug("🎯 Debug: Found %d locations: %s", len(locations), locations)
         return []
     
     overlay = get_overlay()
@@ -307,9 +452,9 @@ def visualize_image_search(search_region: Tuple[int, int, int, int],
     if not enabled:
         # Just print debug info without showing overlay
         if found_locations:
-            print(f"🎯 Debug: {len(found_locations)} matches found in search region {search_region}")
+            logger.debug("🎯 Debug: %d matches found in search region %s", len(found_locations), search_region)
         else:
-            print(f"🔍 Debug: Searching in region {search_region} (no matches)")
+            logger.debug("🔍 Debug: Searching in region %s (no matches)", search_region)
         return
     
     overlay = get_overlay()
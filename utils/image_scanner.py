@@ -4,15 +4,170 @@ Provides functionality to scan for template images within bounding boxes
 and return mouse coordinates for clicking
 """
 import os
+import time
+import queue
+import threading
+import functools
+import hashlib
+import json
 import cv2
 import numpy as np
 from typing import Tuple, Optional, Dict, Any
+from collections import OrderedDict
 import mss
 import platform
 
 # Import graphics utilities for visual feedback
 from .graphics import draw_search_region, draw_found_locations
 
+# Template matching methods selectable by name
+MATCH_METHODS = {
+    "CCOEFF": cv2.TM_CCOEFF_NORMED,
+    "SQDIFF": cv2.TM_SQDIFF_NORMED,
+}
+
+
+# Reusable output buffers keyed by (thread, purpose, shape, dtype); screenshots and match results
+# of the same size are written into the same array instead of allocating a new one per scan.
+# Least recently used buffers are dropped so many distinct regions/threads do not pile up
+_scratch: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_scratch_lock = threading.Lock()
+_SCRATCH_MAX_BUFFERS = 32
+
+
+def _scratch_buffer(purpose: str, shape: tuple, dtype=np.uint8) -> np.ndarray:
+    """
+    Get a preallocated buffer for the given purpose and shape
+    
+    The contents are overwritten by the next call with the same key, so the
+    returned array must not be kept across scans.
+    """
+    # Per thread, so a background prefetch never writes into a buffer the caller is reading
+    key = (threading.get_ident(), purpose, shape, np.dtype(dtype).str)
+    with _scratch_lock:
+        buffer = _scratch.get(key)
+        if buffer is None:
+            buffer = np.empty(shape, dtype=dtype)
+            _scratch[key] = buffer
+            if len(_scratch) > _SCRATCH_MAX_BUFFERS:
+                _scratch.popitem(last=False)
+        else:
+            _scratch.move_to_end(key)
+    return buffer
+
+
+# Last find-all result per (image, bbox, threshold, offset), with a digest of the screenshot it came from.
+# Repeated scans of an unchanged region (e.g. the tree collapse retries) reuse it instead of matching again.
+# Least recently used keys are dropped, since band rescans produce a new bbox every time
+_last_all_scan: "OrderedDict[tuple, Tuple[bytes, list]]" = OrderedDict()
+_last_all_scan_lock = threading.Lock()
+_LAST_ALL_SCAN_MAX = 32
+
+
+# mss grabber per thread - opening one sets up GDI device contexts, which the scans
+# used to repeat on every capture. mss handles can't be shared between threads.
+_grabbers = threading.local()
+
+
+def _get_grabber():
+    """Get this thread's reusable mss screen grabber"""
+    sct = getattr(_grabbers, "sct", None)
+    if sct is None:
+        sct = mss.mss()
+        _grabbers.sct = sct
+    return sct
+
+
+@functools.lru_cache(maxsize=64)
+def _load_template(image_path: str, grayscale: bool = False) -> np.ndarray:
+    """
+    Read and decode a template image once per process
+    
+    ImageScanner instances are short-lived (the convenience functions create
+    one per call), so the decoded templates are cached at module level.
+    The returned array is shared and therefore marked read-only.
+    """
+    if not os.path.exists(image_path):
+        raise FileNotFoundError(f"Template image not found: {image_path}")
+    
+    template = cv2.imread(image_path, cv2.IMREAD_COLOR)
+    if template is None:
+        raise ValueError(f"Could not load image: {image_path}")
+    
+    # Converted the same way as the screenshots so both sides of the match agree
+    if grayscale:
+        template = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+    
+    template.flags.writeable = False
+    return template
+
+
+def preload_templates(image_names: list, images_folder: str = "images", grayscale: bool = True):
+    """
+    Decode templates into the process-wide cache ahead of time
+    
+    Lets the first scan of each template skip the PNG read/decode, e.g. when called
+    from a background thread while the automation is still opening windows.
+    
+    Args:
+        image_names (list): Template image file names
+        images_folder (str): Path to the folder containing template images
+        grayscale (bool): Prepare the grayscale versions used by the default scans instead of BGR
+    """
+    for image_name in image_names:
+        image_path = os.path.join(images_folder, image_name)
+        try:
+            if grayscale:
+                _template_pyramid(_load_template(image_path, True), 1)
+            else:
+                _load_template(image_path, False)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"⚠️ Could not preload template '{image_name}': {e}")
+
+
+# Downscaled template levels, keyed by id() of the cached (read-only) template they were built from.
+# Bounded like the _load_template cache, so pyramids of templates it has evicted are dropped too
+_template_pyramids: "OrderedDict[int, Tuple[np.ndarray, list]]" = OrderedDict()
+_template_pyramids_lock = threading.Lock()
+_TEMPLATE_PYRAMIDS_MAX = 64
+
+
+def _template_pyramid(template: np.ndarray, levels: int) -> list:
+    """
+    Get [template, pyrDown(template), ...] with at least levels + 1 entries, building each level once
+    
+    Only templates from _load_template (read-only) are cached, least recently used first out;
+    other arrays get a freshly built pyramid.
+    """
+    if template.flags.writeable:
+        pyramid = [template]
+        for _ in range(levels):
+            pyramid.append(cv2.pyrDown(pyramid[-1]))
+        return pyramid
+    with _template_pyramids_lock:
+        cached = _template_pyramids.get(id(template))
+        # The entry holds the template itself, so a matching id is never a reused address
+        if cached is None or cached[0] is not template:
+            cached = (template, [template])
+            _template_pyramids[id(template)] = cached
+            if len(_template_pyramids) > _TEMPLATE_PYRAMIDS_MAX:
+                _template_pyramids.popitem(last=False)
+        else:
+            _template_pyramids.move_to_end(id(template))
+    pyramid = cached[1]
+    while len(pyramid) <= levels:
+        pyramid.append(cv2.pyrDown(pyramid[-1]))
+    return pyramid
+
+
+def _dhash(image: np.ndarray, size: int = 16) -> bytes:
+    """
+    Difference hash of a grayscale image: size x size bits, one per pair of horizontally
+    neighbouring cells of a downscaled copy, set where the right cell is brighter
+    """
+    small = cv2.resize(image, (size + 1, size), interpolation=cv2.INTER_AREA)
+    return np.packbits(small[:, 1:] > small[:, :-1]).tobytes()
+
 
 class ImageScanner:
     """
@@ -29,61 +184,76 @@ class ImageScanner:
         self.images_folder = images_folder
         self.template_cache = {}
         
-    def load_template(self, image_name: str) -> Optional[np.ndarray]:
+    def load_template(self, image_name: str, grayscale: bool = False) -> Optional[np.ndarray]:
         """
         Load a template image from the images folder
         
         Args:
             image_name (str): Name of the image file
+            grayscale (bool): Load a single-channel grayscale version of the template
             
         Returns:
             np.ndarray: The loaded template image, or None if not found
         """
         # Check cache first
-        if image_name in self.template_cache:
-            return self.template_cache[image_name]
+        cache_key = (image_name, grayscale)
+        if cache_key in self.template_cache:
+            return self.template_cache[cache_key]
             
         # Construct full path
         image_path = os.path.join(self.images_folder, image_name)
         
-        # Check if file exists
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Template image not found: {image_path}")
-            
-        # Load image
-        template = cv2.imread(image_path, cv2.IMREAD_COLOR)
-        if template is None:
-            raise ValueError(f"Could not load image: {image_path}")
+        # Load image (decoded once per process, see _load_template)
+        template = _load_template(image_path, grayscale)
             
         # Cache the template
-        self.template_cache[image_name] = template
+        self.template_cache[cache_key] = template
         
         return template
     
-    def capture_screen_region(self, bounding_box: Tuple[int, int, int, int]) -> np.ndarray:
+    def capture_screen_region(self, bounding_box: Tuple[int, int, int, int], grayscale: bool = False) -> np.ndarray:
         """
         Capture a specific region of the screen
         
         Args:
             bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of the region
+            grayscale (bool): Return a single-channel grayscale image instead of BGR
             
         Returns:
-            np.ndarray: Screenshot of the specified region
+            np.ndarray: Screenshot of the specified region, owned by the caller
         """
-        x, y, width, height = bounding_box
+        return self._capture_region(bounding_box, grayscale, reuse=False)
+    
+    def _capture_region(self, bounding_box: Tuple[int, int, int, int], grayscale: bool = False,
+                        reuse: bool = True) -> np.ndarray:
+        """
+        Capture a specific region of the screen, by default into a reusable scratch buffer
+        for scans that only use the image until they return
         
-        with mss.mss() as sct:
-            # Define the region to capture
-            region = {"top": y, "left": x, "width": width, "height": height}
-            
-            # Capture the screen region
-            screenshot = sct.grab(region)
-            
-            # Convert to numpy array (BGR format for OpenCV)
-            img = np.array(screenshot)
-            img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+        Args:
+            bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of the region
+            grayscale (bool): Return a single-channel grayscale image instead of BGR
+            reuse (bool): Convert into the scratch buffer instead of a new array
             
-            return img
+        Returns:
+            np.ndarray: Screenshot of the specified region. With reuse the array is overwritten
+                by the next capture of the same size, so copy it if it has to be kept.
+        """
+        x, y, width, height = bounding_box
+        
+        # Define the region to capture
+        region = {"top": y, "left": x, "width": width, "height": height}
+        
+        # Capture the screen region
+        screenshot = _get_grabber().grab(region)
+        
+        # View the raw BGRA bytes without copying, then convert into the reusable BGR buffer
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+        if grayscale:
+            img = _scratch_buffer("screenshot_gray", (screenshot.height, screenshot.width)) if reuse else None
+            return cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY, dst=img)
+        img = _scratch_buffer("screenshot", (screenshot.height, screenshot.width, 3)) if reuse else None
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=img)
     
     def find_template_in_region(self, 
                                template: np.ndarray, 
@@ -102,32 +272,232 @@ class ImageScanner:
         Returns:
             Tuple[int, int, float]: (x, y, confidence) of the best match, or None if not found
         """
-        # Perform template matching
-        result = cv2.matchTemplate(region_image, template, method)
+        # Perform template matching into a reused result buffer
+        result_shape = (region_image.shape[0] - template.shape[0] + 1, region_image.shape[1] - template.shape[1] + 1)
+        result = _scratch_buffer("match", result_shape, np.float32)
+        cv2.matchTemplate(region_image, template, method, result=result)
         
         # Find the best match
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-        
-        # For correlation methods, we want the maximum value
-        if method in [cv2.TM_CCOEFF_NORMED, cv2.TM_CCORR_NORMED]:
-            confidence = max_val
-            match_loc = max_loc
-        else:
-            confidence = 1.0 - min_val
-            match_loc = min_loc
+        confidence, match_loc = self._best_match(result, method)
         
         # Check if confidence meets threshold
         if confidence >= threshold:
             return match_loc[0], match_loc[1], confidence
         
         return None
+
+    def match_score_around(self, image_name: str, center: Tuple[int, int], margin: int = 8) -> float:
+        """
+        Match a template only in a small window around a screen point
+        
+        Much cheaper than rescanning a whole region when checking whether a known match
+        (e.g. an icon that was just clicked) is still there.
+        
+        Args:
+            image_name (str): Name of the template image file
+            center (Tuple[int, int]): Screen (x, y) the template was centered on
+            margin (int): Extra pixels searched on each side of the template
+            
+        Returns:
+            float: Best TM_CCOEFF_NORMED score in the window (0.0 if the template is missing)
+        """
+        template = self.load_template(image_name, grayscale=True)
+        if template is None:
+            return 0.0
+        template_height, template_width = template.shape[:2]
+        x, y = center
+        window = (x - template_width // 2 - margin, y - template_height // 2 - margin,
+                  template_width + 2 * margin, template_height + 2 * margin)
+        region_image = self._capture_region(window, grayscale=True)
+        confidence, _ = self._best_match(cv2.matchTemplate(region_image, template, cv2.TM_CCOEFF_NORMED),
+                                         cv2.TM_CCOEFF_NORMED)
+        return confidence
+
+    def wait_region_stable(self, bounding_box: Tuple[int, int, int, int],
+                           interval: float = 0.03, timeout: float = 0.5) -> Optional[bytes]:
+        """
+        Wait until two consecutive captures of a region have the same perceptual hash
+        
+        A blinking caret or antialiasing noise does not count as a change, a redrawn layout does.
+        
+        Args:
+            bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of the region
+            interval (float): Pause between captures (seconds)
+            timeout (float): Maximum time to wait (seconds)
+            
+        Returns:
+            bytes: Hash of the settled region, or None if it was still changing at the timeout
+        """
+        deadline = time.time() + timeout
+        previous = None
+        while True:
+            digest = self.region_digest(bounding_box)
+            if digest == previous:
+                return digest
+            previous = digest
+            if time.time() >= deadline:
+                return None
+            time.sleep(interval)
+
+    def region_digest(self, bounding_box: Tuple[int, int, int, int]) -> bytes:
+        """
+        Perceptual hash of a screen region, to compare against a later capture
+        
+        Args:
+            bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of the region
+            
+        Returns:
+            bytes: Difference hash of the region
+        """
+        return _dhash(self._capture_region(bounding_box, grayscale=True))
     
-    def scan_for_image(self, 
+    def wait_region_change(self, bounding_box: Tuple[int, int, int, int], previous: bytes,
+                           interval: float = 0.02, timeout: float = 0.5) -> bool:
+        """
+        Wait until a region no longer looks like an earlier region_digest, then until it settles
+        
+        Args:
+            bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of the region
+            previous (bytes): region_digest taken before the action that should change the region
+            interval (float): Pause between captures (seconds)
+            timeout (float): Maximum time to wait for the change and the settling together (seconds)
+            
+        Returns:
+            bool: True if the region changed, False if it still looked the same at the timeout
+        """
+        deadline = time.time() + timeout
+        while self.region_digest(bounding_box) == previous:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+        # Expanding a node can redraw in several steps - use what is left of the timeout to let it finish
+        self.wait_region_stable(bounding_box, interval=interval, timeout=max(0.0, deadline - time.time()))
+        return True
+
+    @staticmethod
+    def _best_match(result: np.ndarray, method: int) -> Tuple[float, Tuple[int, int]]:
+        """
+        Get the best score and location from a matchTemplate result map
+        
+        Returns:
+            Tuple[float, Tuple[int, int]]: (confidence, (x, y)) where higher confidence is better
+        """
+        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+        
+        # For correlation methods, we want the maximum value
+        if method in [cv2.TM_CCOEFF_NORMED, cv2.TM_CCORR_NORMED]:
+            return max_val, max_loc
+        # For squared difference methods, the best match is the minimum
+        return 1.0 - min_val, min_loc
+
+    @staticmethod
+    def _build_pyramids(template: np.ndarray,
+                        region_image: np.ndarray,
+                        levels: int,
+                        min_template_size: int,
+                        shared_region_levels: Optional[list] = None) -> Tuple[list, list]:
+        """
+        Build matching pyramids for a region and a template, keeping the template
+        large enough to stay distinctive and smaller than the region at every level
+        
+        shared_region_levels, if given, holds region levels built for an earlier template
+        matched against the same capture; it is reused and extended in place
+        """
+        if shared_region_levels is None:
+            shared_region_levels = [region_image]
+        region_levels = [region_image]
+        template_levels = [template]
+        for level in range(levels):
+            th, tw = template_levels[-1].shape[:2]
+            ih, iw = region_levels[-1].shape[:2]
+            if min(th, tw) // 2 < min_template_size or ih // 2 < th // 2 + 1 or iw // 2 < tw // 2 + 1:
+                break
+            if len(shared_region_levels) <= level + 1:
+                shared_region_levels.append(cv2.pyrDown(shared_region_levels[-1]))
+            region_levels.append(shared_region_levels[level + 1])
+            # Template levels never change, so they come from the per-template cache
+            template_levels.append(_template_pyramid(template, level + 1)[level + 1])
+        return region_levels, template_levels
+
+    def find_template_in_region_pyramid(self,
+                                        template: np.ndarray,
+                                        region_image: np.ndarray,
+                                        threshold: float = 0.8,
+                                        levels: int = 3,
+                                        min_template_size: int = 8,
+                                        method: int = cv2.TM_CCOEFF_NORMED,
+                                        full_fallback: bool = True) -> Optional[Tuple[int, int, float]]:
+        """
+        Find a template using a coarse-to-fine image pyramid
+
+        The best match is located on a downscaled copy of the region and then
+        refined level by level inside a small window around the candidate, so
+        most of the matching work happens on far fewer pixels. Falls back to a
+        full resolution search if the coarse candidate does not hold up.
+
+        Args:
+            template (np.ndarray): The template image to search for
+            region_image (np.ndarray): The region to search in
+            threshold (float): Minimum confidence threshold (0.0 to 1.0)
+            levels (int): Maximum number of pyrDown steps
+            min_template_size (int): Stop downscaling once the template would get smaller than this
+            method (int): OpenCV template matching method
+            full_fallback (bool): Run the full resolution search when the coarse pass finds nothing;
+                polling callers that will scan again anyway can skip it
+
+        Returns:
+            Tuple[int, int, float]: (x, y, confidence) of the best match, or None if not found
+        """
+        region_levels, template_levels = self._build_pyramids(template, region_image, levels, min_template_size)
+
+        coarsest = len(region_levels) - 1
+        if coarsest == 0:
+            return self.find_template_in_region(template, region_image, threshold, method)
+
+        # Coarse pass - threshold is relaxed slightly per level to account for downscaling
+        coarse_threshold = threshold - 0.01 * coarsest
+        result = cv2.matchTemplate(region_levels[coarsest], template_levels[coarsest], method)
+        confidence, (match_x, match_y) = self._best_match(result, method)
+        if confidence < coarse_threshold:
+            if not full_fallback:
+                return None
+            return self.find_template_in_region(template, region_image, threshold, method)
+
+        # Refine the candidate at each finer level inside a window around it
+        for level in range(coarsest - 1, -1, -1):
+            level_image = region_levels[level]
+            level_template = template_levels[level]
+            th, tw = level_template.shape[:2]
+            ih, iw = level_image.shape[:2]
+
+            x0 = max(0, match_x * 2 - tw)
+            y0 = max(0, match_y * 2 - th)
+            x1 = min(iw, match_x * 2 + 2 * tw)
+            y1 = min(ih, match_y * 2 + 2 * th)
+
+            window = level_image[y0:y1, x0:x1]
+            if window.shape[0] < th or window.shape[1] < tw:
+                return self.find_template_in_region(template, region_image, threshold, method)
+
+            result = cv2.matchTemplate(window, level_template, method)
+            confidence, best_loc = self._best_match(result, method)
+            match_x, match_y = x0 + best_loc[0], y0 + best_loc[1]
+
+        if confidence >= threshold:
+            return match_x, match_y, confidence
+
+        # The coarse candidate was wrong - do the full resolution search
+        return self.find_template_in_region(template, region_image, threshold, method)
+
+    def scan_for_image(self,
                       image_name: str, 
                       bounding_box: Tuple[int, int, int, int],
                       threshold: float = 0.8,
                       click_offset: Tuple[int, int] = (0, 0),
-                      animated_image: bool = False) -> Optional[Tuple[int, int]]:
+                      animated_image: bool = False,
+                      method: str = "CCOEFF",
+                      grayscale: bool = True) -> Optional[Tuple[int, int]]:
         """
         Scan for an image within a bounding box and return mouse click coordinates
         
@@ -137,6 +507,8 @@ class ImageScanner:
             threshold (float): Minimum confidence threshold for template matching
             click_offset (Tuple[int, int]): Offset from template center for click position
             animated_image (bool): If True, uses robust search for animated/transitioning UI elements
+            method (str): Matching method name from MATCH_METHODS ("CCOEFF" or "SQDIFF")
+            grayscale (bool): Match single-channel images, a third of the work of BGR matching
             
         Returns:
             Tuple[int, int]: (x, y) coordinates for mouse click, or None if not found
@@ -149,9 +521,11 @@ class ImageScanner:
         
         # Perform the actual scan
         if animated_image:
-            result = self._scan_animated_image(image_name, bounding_box, threshold, click_offset)
+            result = self._scan_animated_image(image_name, bounding_box, threshold, click_offset,
+                                               grayscale=grayscale)
         else:
-            result = self._scan_standard_image(image_name, bounding_box, threshold, click_offset)
+            result = self._scan_standard_image(image_name, bounding_box, threshold, click_offset,
+                                               method=method, grayscale=grayscale)
         
         # Draw found locations if scan was successful
         if result is not None:
@@ -159,65 +533,145 @@ class ImageScanner:
         
         return result
     
+    def scan_for_image_pyramid(self,
+                               image_name: str,
+                               bounding_box: Tuple[int, int, int, int],
+                               threshold: float = 0.8,
+                               levels: int = 3,
+                               click_offset: Tuple[int, int] = (0, 0),
+                               method: str = "CCOEFF",
+                               grayscale: bool = True,
+                               full_fallback: bool = True) -> Optional[Tuple[int, int]]:
+        """
+        Scan for an image using coarse-to-fine pyramid matching
+        
+        Args:
+            image_name (str): Name of the template image file
+            bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of search area
+            threshold (float): Minimum confidence threshold for template matching
+            levels (int): Maximum number of pyramid levels used for the coarse pass
+            click_offset (Tuple[int, int]): Offset from template center for click position
+            method (str): Matching method name from MATCH_METHODS ("CCOEFF" or "SQDIFF")
+            grayscale (bool): Match single-channel images, a third of the work of BGR matching
+            full_fallback (bool): Do a full resolution search when the coarse pass finds nothing
+            
+        Returns:
+            Tuple[int, int]: (x, y) coordinates for mouse click, or None if not found
+        """
+        x, y, width, height = bounding_box
+        draw_search_region(x, y, x + width, y + height, 
+                          label=f"Scanning for {image_name}", 
+                          color="", enabled=True, auto_hide_seconds=0)
+        
+        result = self._scan_standard_image(image_name, bounding_box, threshold, click_offset,
+                                           pyramid_levels=levels, method=method, grayscale=grayscale,
+                                           full_fallback=full_fallback)
+        
+        if result is not None:
+            draw_found_locations([result], color="", enabled=True, auto_hide_seconds=5.0)
+        
+        return result
+    
     def _scan_standard_image(self, 
                            image_name: str, 
                            bounding_box: Tuple[int, int, int, int],
                            threshold: float = 0.8,
-                           click_offset: Tuple[int, int] = (0, 0)) -> Optional[Tuple[int, int]]:
+                           click_offset: Tuple[int, int] = (0, 0),
+                           pyramid_levels: int = 0,
+                           method: str = "CCOEFF",
+                           grayscale: bool = False,
+                           full_fallback: bool = True) -> Optional[Tuple[int, int]]:
         """
         Standard image scanning method (original implementation)
+        Uses pyramid matching when pyramid_levels > 0 and single-channel images when grayscale is set
         """
         try:
             # Load the template image
-            template = self.load_template(image_name)
+            template = self.load_template(image_name, grayscale)
             
             # Capture the screen region
-            region_image = self.capture_screen_region(bounding_box)
-            
-            # Find the template in the region
-            match_result = self.find_template_in_region(template, region_image, threshold)
-            
-            if match_result is None:
-                return None
-            
-            # Extract match coordinates and confidence
-            template_x, template_y, confidence = match_result
-            
-            # Get template dimensions
-            template_height, template_width = template.shape[:2]
+            region_image = self._capture_region(bounding_box, grayscale)
             
-            # Calculate the center of the matched template
-            center_x = template_x + template_width // 2
-            center_y = template_y + template_height // 2
-            
-            # Apply click offset
-            click_x = center_x + click_offset[0]
-            click_y = center_y + click_offset[1]
-            
-            # Convert relative coordinates to absolute screen coordinates
-            absolute_x = bounding_box[0] + click_x
-            absolute_y = bounding_box[1] + click_y
-            
-            return absolute_x, absolute_y
+            return self._locate_in_region(template, region_image, bounding_box, threshold, click_offset,
+                                          pyramid_levels, method, full_fallback)
             
         except Exception as e:
             print(f"Error scanning for image '{image_name}': {str(e)}")
             return None
     
+    def _locate_in_region(self,
+                          template: np.ndarray,
+                          region_image: np.ndarray,
+                          bounding_box: Tuple[int, int, int, int],
+                          threshold: float = 0.8,
+                          click_offset: Tuple[int, int] = (0, 0),
+                          pyramid_levels: int = 0,
+                          method: str = "CCOEFF",
+                          full_fallback: bool = True) -> Optional[Tuple[int, int]]:
+        """
+        Match a template against an already captured region and return absolute click coordinates
+        """
+        match_method = MATCH_METHODS[method]
+        # Find the template in the region
+        if pyramid_levels > 0:
+            match_result = self.find_template_in_region_pyramid(template, region_image, threshold, pyramid_levels,
+                                                                method=match_method, full_fallback=full_fallback)
+        else:
+            match_result = self.find_template_in_region(template, region_image, threshold, match_method)
+        
+        if match_result is None:
+            return None
+        
+        # Extract match coordinates and confidence
+        template_x, template_y, confidence = match_result
+        
+        # Get template dimensions
+        template_height, template_width = template.shape[:2]
+        
+        # Calculate the center of the matched template
+        center_x = template_x + template_width // 2
+        center_y = template_y + template_height // 2
+        
+        # Apply click offset
+        click_x = center_x + click_offset[0]
+        click_y = center_y + click_offset[1]
+        
+        # Convert relative coordinates to absolute screen coordinates
+        absolute_x = bounding_box[0] + click_x
+        absolute_y = bounding_box[1] + click_y
+        
+        return absolute_x, absolute_y
+    
     def _scan_animated_image(self, 
                            image_name: str, 
                            bounding_box: Tuple[int, int, int, int],
                            base_threshold: float = 0.8,
                            click_offset: Tuple[int, int] = (0, 0),
-                           max_attempts: int = 5) -> Optional[Tuple[int, int]]:
+                           max_attempts: int = 5,
+                           grayscale: bool = True) -> Optional[Tuple[int, int]]:
         """
         Robust image scanning method for animated/transitioning UI elements
         Uses multiple threshold levels and attempts to handle Windows animations
         """
-        import time
+        return self._scan_animated_images([image_name], bounding_box, base_threshold,
+                                          click_offset, max_attempts, grayscale).get(image_name)
+    
+    def _scan_animated_images(self, 
+                            image_names: list, 
+                            bounding_box: Tuple[int, int, int, int],
+                            base_threshold: float = 0.8,
+                            click_offset: Tuple[int, int] = (0, 0),
+                            max_attempts: int = 5,
+                            grayscale: bool = True) -> Dict[str, Tuple[int, int]]:
+        """
+        Robust scan for several animated/transitioning UI elements in the same region
+        Each attempt captures the region once and matches every image that is still missing
         
+        Returns:
+            Dict[str, Tuple[int, int]]: Click coordinates of the images that were found
+        """
         # Generate possible image variations (normal, focused, hover, etc.)
-        image_variations = self._generate_image_variations(image_name)
+        image_variations = {name: self._generate_image_variations(name) for name in image_names}
         
         # Progressive thresholds - start strict, get more lenient
         thresholds = [base_threshold, base_threshold - 0.05, base_threshold - 0.1, 
@@ -229,59 +683,77 @@ class ImageScanner:
         # Wait a moment for any ongoing animations to settle
         time.sleep(0.1)
         
+        found = {}
         for attempt in range(max_attempts):
             # Capture screen region for this attempt
             try:
-                region_image = self.capture_screen_region(bounding_box)
+                region_image = self._capture_region(bounding_box, grayscale)
             except Exception as e:
                 print(f"⚠️ Error capturing screen region on attempt {attempt + 1}: {e}")
                 continue
             
-            for threshold in thresholds:
-                for variation in image_variations:
-                    try:
-                        # Load the template image variation
-                        template = self.load_template(variation)
-                        
-                        # Find the template in the region
-                        match_result = self.find_template_in_region(template, region_image, threshold)
-                        
-                        if match_result is not None:
-                            # Extract match coordinates and confidence
-                            template_x, template_y, confidence = match_result
-                            
-                            # Get template dimensions
-                            template_height, template_width = template.shape[:2]
-                            
-                            # Calculate the center of the matched template
-                            center_x = template_x + template_width // 2
-                            center_y = template_y + template_height // 2
-                            
-                            # Apply click offset
-                            click_x = center_x + click_offset[0]
-                            click_y = center_y + click_offset[1]
-                            
-                            # Convert relative coordinates to absolute screen coordinates
-                            absolute_x = bounding_box[0] + click_x
-                            absolute_y = bounding_box[1] + click_y
-                            
-                            print(f"✅ Animated image '{image_name}' found using '{variation}' "
-                                  f"(threshold: {threshold:.2f}, confidence: {confidence:.2f})")
-                            
-                            return absolute_x, absolute_y
-                            
-                    except FileNotFoundError:
-                        # Skip missing image variations
-                        continue
-                    except Exception as e:
-                        # Skip this variation and continue
-                        continue
+            for image_name in image_names:
+                if image_name in found:
+                    continue
+                location = self._match_animated_variations(image_name, image_variations[image_name], region_image,
+                                                           bounding_box, thresholds, click_offset, grayscale)
+                if location:
+                    found[image_name] = location
+            
+            if len(found) == len(image_names):
+                return found
             
             # Wait between attempts for animations to settle
             if attempt < max_attempts - 1:
                 time.sleep(0.2)
         
-        print(f"❌ Animated image '{image_name}' not found after {max_attempts} attempts")
+        for image_name in image_names:
+            if image_name not in found:
+                print(f"❌ Animated image '{image_name}' not found after {max_attempts} attempts")
+        return found
+    
+    def _match_animated_variations(self, image_name, variations, region_image, bounding_box,
+                                   thresholds, click_offset, grayscale=True) -> Optional[Tuple[int, int]]:
+        """Match the variations of an animated image against one capture, strictest threshold first"""
+        for threshold in thresholds:
+            for variation in variations:
+                try:
+                    # Load the template image variation
+                    template = self.load_template(variation, grayscale)
+                    
+                    # Find the template in the region
+                    match_result = self.find_template_in_region(template, region_image, threshold)
+                    
+                    if match_result is not None:
+                        # Extract match coordinates and confidence
+                        template_x, template_y, confidence = match_result
+                        
+                        # Get template dimensions
+                        template_height, template_width = template.shape[:2]
+                        
+                        # Calculate the center of the matched template
+                        center_x = template_x + template_width // 2
+                        center_y = template_y + template_height // 2
+                        
+                        # Apply click offset
+                        click_x = center_x + click_offset[0]
+                        click_y = center_y + click_offset[1]
+                        
+                        # Convert relative coordinates to absolute screen coordinates
+                        absolute_x = bounding_box[0] + click_x
+                        absolute_y = bounding_box[1] + click_y
+                        
+                        print(f"✅ Animated image '{image_name}' found using '{variation}' "
+                              f"(threshold: {threshold:.2f}, confidence: {confidence:.2f})")
+                        
+                        return absolute_x, absolute_y
+                        
+                except FileNotFoundError:
+                    # Skip missing image variations
+                    continue
+                except Exception as e:
+                    # Skip this variation and continue
+                    continue
         return None
     
     def _generate_image_variations(self, image_name: str) -> list:
@@ -341,7 +813,9 @@ class ImageScanner:
                                 image_names: list, 
                                 bounding_box: Tuple[int, int, int, int],
                                 threshold: float = 0.8,
-                                animated_image: bool = False) -> Dict[str, Tuple[int, int]]:
+                                animated_image: bool = False,
+                                grayscale: bool = True,
+                                pyramid_levels: int = 0) -> Dict[str, Tuple[int, int]]:
         """
         Scan for multiple images within a bounding box
         
@@ -350,6 +824,8 @@ class ImageScanner:
             bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of search area
             threshold (float): Minimum confidence threshold for template matching
             animated_image (bool): If True, uses robust search for animated/transitioning UI elements
+            grayscale (bool): Match single-channel images (the capture is converted once for all templates)
+            pyramid_levels (int): Find each candidate on a downscaled copy first (0 for a full resolution search)
             
         Returns:
             Dict[str, Tuple[int, int]]: Dictionary mapping image names to click coordinates
@@ -362,18 +838,31 @@ class ImageScanner:
                           color="", enabled=True, auto_hide_seconds=0)
         
         results = {}
-        found_locations = []
         
-        for image_name in image_names:
-            # Call the internal scanning methods directly to avoid duplicate visual feedback
-            if animated_image:
-                location = self._scan_animated_image(image_name, bounding_box, threshold, (0, 0))
-            else:
-                location = self._scan_standard_image(image_name, bounding_box, threshold, (0, 0))
+        # Call the internal scanning methods directly to avoid duplicate visual feedback
+        if animated_image:
+            # Each attempt captures once and matches every image still missing against that capture
+            results = self._scan_animated_images(image_names, bounding_box, threshold, (0, 0), grayscale=grayscale)
+        else:
+            # All templates are matched against the same screenshot, so capture it only once
+            try:
+                region_image = self._capture_region(bounding_box, grayscale)
+            except Exception as e:
+                print(f"Error capturing region for multiple images: {str(e)}")
+                return results
             
-            if location:
-                results[image_name] = location
-                found_locations.append(location)
+            for image_name in image_names:
+                try:
+                    location = self._locate_in_region(self.load_template(image_name, grayscale), region_image,
+                                                      bounding_box, threshold, pyramid_levels=pyramid_levels)
+                except Exception as e:
+                    print(f"Error scanning for image '{image_name}': {str(e)}")
+                    location = None
+                
+                if location:
+                    results[image_name] = location
+        
+        found_locations = list(results.values())
         
         # Draw all found locations
         if found_locations:
@@ -426,16 +915,82 @@ class ImageScanner:
         # Perform template matching
         result = cv2.matchTemplate(region_image, template, method)
         
-        # Find all locations above threshold
-        locations = np.where(result >= threshold)
-        matches = []
+        # Non-maximum suppression on the score map: keep only scores above threshold that are
+        # the maximum of their neighbourhood (same radius as _remove_overlapping_matches)
+        template_height, template_width = template.shape[:2]
+        radius = max(1, int(min(template_width, template_height) * 0.5))
+        neighbourhood_max = cv2.dilate(result, np.ones((2 * radius + 1, 2 * radius + 1), np.uint8))
+        locations = np.where((result >= threshold) & (result == neighbourhood_max))
         
         # Convert locations to list of matches
-        for pt in zip(*locations[::-1]):  # Switch x and y coordinates
-            confidence = result[pt[1], pt[0]]  # Note: result uses (y, x) indexing
-            matches.append((pt[0], pt[1], confidence))
+        confidences = result[locations]
+        matches = [(int(x), int(y), float(confidence))
+                   for y, x, confidence in zip(locations[0], locations[1], confidences)]
+        
+        # Flat peaks can leave a few neighbouring maxima with equal scores - drop those
+        if matches:
+            matches = self._remove_overlapping_matches(matches, template.shape[:2])
+        
+        return matches
+    
+    def find_all_templates_in_region_pyramid(self,
+                                             template: np.ndarray,
+                                             region_image: np.ndarray,
+                                             threshold: float = 0.8,
+                                             levels: int = 2,
+                                             coarse_threshold: float = 0.7,
+                                             min_template_size: int = 6,
+                                             method: int = cv2.TM_CCOEFF_NORMED,
+                                             shared_region_levels: Optional[list] = None) -> list:
+        """
+        Find all occurrences of a template using a coarse-to-fine image pyramid
+        
+        Candidates are collected on a downscaled copy of the region with a relaxed
+        threshold, then each one is confirmed at full resolution inside a small
+        window around it.
+        
+        Args:
+            template (np.ndarray): The template image to search for
+            region_image (np.ndarray): The region to search in
+            threshold (float): Minimum confidence threshold at full resolution
+            levels (int): Maximum number of pyrDown steps
+            coarse_threshold (float): Threshold for candidates on the coarsest level
+            min_template_size (int): Stop downscaling once the template would get smaller than this
+            method (int): OpenCV template matching method
+            shared_region_levels (list): Downscaled copies of region_image to reuse across templates
+            
+        Returns:
+            list: List of tuples (x, y, confidence) for all matches above threshold
+        """
+        region_levels, template_levels = self._build_pyramids(template, region_image, levels, min_template_size,
+                                                              shared_region_levels)
+        coarsest = len(region_levels) - 1
+        if coarsest == 0:
+            return self.find_all_templates_in_region(template, region_image, threshold, method)
+        
+        candidates = self.find_all_templates_in_region(template_levels[coarsest], region_levels[coarsest],
+                                                       coarse_threshold, method)
+        
+        # Each coarse pixel covers 2^levels full resolution pixels, plus a little slack for pyrDown blurring
+        scale = 2 ** coarsest
+        margin = scale + 4
+        template_height, template_width = template.shape[:2]
+        image_height, image_width = region_image.shape[:2]
+        
+        matches = []
+        for coarse_x, coarse_y, _ in candidates:
+            x0 = max(0, coarse_x * scale - margin)
+            y0 = max(0, coarse_y * scale - margin)
+            x1 = min(image_width, coarse_x * scale + template_width + margin)
+            y1 = min(image_height, coarse_y * scale + template_height + margin)
+            window = region_image[y0:y1, x0:x1]
+            if window.shape[0] < template_height or window.shape[1] < template_width:
+                continue
+            
+            match = self.find_template_in_region(template, window, threshold, method)
+            if match is not None:
+                matches.append((x0 + match[0], y0 + match[1], match[2]))
         
-        # Remove overlapping matches (non-maximum suppression)
         if matches:
             matches = self._remove_overlapping_matches(matches, template.shape[:2])
         
@@ -455,112 +1010,152 @@ class ImageScanner:
         if not matches:
             return matches
         
-        # Sort by confidence (highest first)
-        matches = sorted(matches, key=lambda x: x[2], reverse=True)
-        
         template_height, template_width = template_size
-        filtered_matches = []
+        min_distance = min(template_width, template_height) * 0.5
         
-        for match in matches:
-            x, y, confidence = match
-            
-            # Check if this match overlaps with any already accepted match
-            overlaps = False
-            for accepted_match in filtered_matches:
-                ax, ay, _ = accepted_match
-                
-                # Check for overlap (if centers are too close)
-                center_distance = np.sqrt((x - ax)**2 + (y - ay)**2)
-                min_distance = min(template_width, template_height) * 0.5
-                
-                if center_distance < min_distance:
-                    overlaps = True
-                    break
-            
-            if not overlaps:
-                filtered_matches.append(match)
+        # Sort by confidence (highest first)
+        points = np.asarray(matches, dtype=np.float64)
+        order = np.argsort(-points[:, 2], kind="stable")
+        points = points[order]
         
-        return filtered_matches
+        # Greedy suppression: each kept match removes every weaker match whose center is too close
+        suppressed = np.zeros(len(points), dtype=bool)
+        keep = []
+        for i in range(len(points)):
+            if suppressed[i]:
+                continue
+            keep.append(i)
+            distance = np.hypot(points[i:, 0] - points[i, 0], points[i:, 1] - points[i, 1])
+            suppressed[i:] |= distance < min_distance
+        
+        return [matches[order[i]] for i in keep]
 
     def scan_for_all_images(self, 
-                           image_name: str, 
+                           image_name, 
                            bounding_box: Tuple[int, int, int, int],
                            threshold: float = 0.8,
                            click_offset: Tuple[int, int] = (0, 0),
-                           animated_image: bool = False) -> list:
+                           animated_image: bool = False,
+                           pyramid_levels: int = 0,
+                           show_overlay: bool = True,
+                           as_array: bool = False,
+                           grayscale: bool = True):
         """
         Scan for all occurrences of an image within a bounding box
         
         Args:
-            image_name (str): Name of the template image file
+            image_name (str | list): Name of the template image file, or a list of variants matched against one capture
             bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of search area
             threshold (float): Minimum confidence threshold for template matching
             click_offset (Tuple[int, int]): Offset from template center for click position
             animated_image (bool): If True, uses robust search for animated/transitioning UI elements
+            pyramid_levels (int): Find candidates on a downscaled copy first (0 for a full resolution search)
+            show_overlay (bool): Draw the search region and matches; must be False off the main thread
+            as_array (bool): Return an (N, 2) int32 array of x/y columns instead of a list of tuples
+            grayscale (bool): Match single-channel images
             
         Returns:
-            list: List of (x, y) coordinates for all found instances
+            list: List of (x, y) coordinates for all found instances (np.ndarray if as_array)
         """
         # Draw search region before starting scan to show "scanning in progress"
         x, y, width, height = bounding_box
         draw_search_region(x, y, x + width, y + height, 
                           label=f"Scanning for all: {image_name}", 
-                          color="", enabled=True, auto_hide_seconds=0)
+                          color="", enabled=show_overlay, auto_hide_seconds=0)
         
         # Perform the actual scan
         if animated_image:
             # For animated images, we'll use the robust single-image search
             # Note: Finding all occurrences of animated images is complex due to state changes
             # So we'll find the first occurrence using animated search
-            result = self._scan_animated_image(image_name, bounding_box, threshold, click_offset)
-            results = [result] if result else []
+            image_names = [image_name] if isinstance(image_name, str) else list(image_name)
+            results = list(self._scan_animated_images(image_names, bounding_box, threshold, click_offset,
+                                                      grayscale=grayscale).values())
         else:
             # Use the standard approach for non-animated images
-            results = self._scan_for_all_images_standard(image_name, bounding_box, threshold, click_offset)
+            results = self._scan_for_all_images_standard(image_name, bounding_box, threshold, click_offset,
+                                                         pyramid_levels, grayscale)
         
         # Draw found locations if scan was successful
         if results:
-            draw_found_locations(results, color="", enabled=True, auto_hide_seconds=5.0)
+            draw_found_locations(results, color="", enabled=show_overlay, auto_hide_seconds=5.0)
         
+        if as_array:
+            return np.asarray(results, dtype=np.int32).reshape(-1, 2)
         return results
     
     def _scan_for_all_images_standard(self, 
-                                    image_name: str, 
+                                    image_name, 
                                     bounding_box: Tuple[int, int, int, int],
                                     threshold: float = 0.8,
-                                    click_offset: Tuple[int, int] = (0, 0)) -> list:
+                                    click_offset: Tuple[int, int] = (0, 0),
+                                    pyramid_levels: int = 0,
+                                    grayscale: bool = True) -> list:
         """
         Standard implementation for finding all occurrences of an image
+        Uses pyramid matching when pyramid_levels > 0 and single-channel images when grayscale is set
+        
+        image_name may also be a list of template variants (e.g. normal and hover states); they are
+        all matched against one capture and one set of downscaled region levels, and the results merged
         """
+        image_names = [image_name] if isinstance(image_name, str) else list(image_name)
         try:
-            # Load the template image
-            template = self.load_template(image_name)
-            
             # Capture the screen region
-            region_image = self.capture_screen_region(bounding_box)
+            region_image = self._capture_region(bounding_box, grayscale)
             
-            # Find all occurrences of the template in the region
-            matches = self.find_all_templates_in_region(template, region_image, threshold)
+            # Nothing changed on screen since the last identical scan - the matches are the same
+            scan_key = (self.images_folder, tuple(image_names), tuple(bounding_box), threshold, tuple(click_offset), pyramid_levels, grayscale)
+            digest = hashlib.blake2b(region_image.data, digest_size=16).digest()
+            with _last_all_scan_lock:
+                cached = _last_all_scan.get(scan_key)
+                if cached is not None:
+                    _last_all_scan.move_to_end(scan_key)
+            if cached is not None and cached[0] == digest:
+                return list(cached[1])
             
-            # Convert to absolute coordinates with click offset
             results = []
-            template_height, template_width = template.shape[:2]
-            
-            for match_x, match_y, confidence in matches:
-                # Calculate the center of the matched template
-                center_x = match_x + template_width // 2
-                center_y = match_y + template_height // 2
+            centers = []
+            region_levels = [region_image]
+            for name in image_names:
+                # Load the template image
+                template = self.load_template(name, grayscale)
                 
-                # Apply click offset
-                click_x = center_x + click_offset[0]
-                click_y = center_y + click_offset[1]
+                # Find all occurrences of the template in the region
+                if pyramid_levels > 0:
+                    matches = self.find_all_templates_in_region_pyramid(template, region_image, threshold, pyramid_levels,
+                                                                        shared_region_levels=region_levels)
+                else:
+                    matches = self.find_all_templates_in_region(template, region_image, threshold)
                 
-                # Convert to absolute screen coordinates
-                absolute_x = bounding_box[0] + click_x
-                absolute_y = bounding_box[1] + click_y
+                # Convert to absolute coordinates with click offset
+                template_height, template_width = template.shape[:2]
+                min_distance = min(template_width, template_height) * 0.5
                 
-                results.append((absolute_x, absolute_y))
+                for match_x, match_y, confidence in matches:
+                    # Calculate the center of the matched template
+                    center_x = match_x + template_width // 2
+                    center_y = match_y + template_height // 2
+                    
+                    # Another variant already matched this spot
+                    if any(abs(center_x - x) < min_distance and abs(center_y - y) < min_distance for x, y in centers):
+                        continue
+                    centers.append((center_x, center_y))
+                    
+                    # Apply click offset
+                    click_x = center_x + click_offset[0]
+                    click_y = center_y + click_offset[1]
+                    
+                    # Convert to absolute screen coordinates
+                    absolute_x = bounding_box[0] + click_x
+                    absolute_y = bounding_box[1] + click_y
+                    
+                    results.append((absolute_x, absolute_y))
             
+            with _last_all_scan_lock:
+                _last_all_scan[scan_key] = (digest, list(results))
+                _last_all_scan.move_to_end(scan_key)
+                if len(_last_all_scan) > _LAST_ALL_SCAN_MAX:
+                    _last_all_scan.popitem(last=False)
             return results
             
         except Exception as e:
@@ -568,13 +1163,102 @@ class ImageScanner:
             return []
 
 
+class PrefetchScanner:
+    """
+    Scans for an image on a background thread so the location is already known
+    by the time the automation needs it (e.g. while keystrokes are still being processed).
+    
+    The worker keeps scanning until the image appears or the timeout passes.
+    No overlays are drawn from the worker thread since tkinter is not thread-safe.
+    """
+    
+    def __init__(self, images_folder: str = "images"):
+        self.scanner = ImageScanner(images_folder)
+        self._requests = queue.Queue()
+        self._results = {}  # image_name -> {"done": Event, "location": (x, y) or None}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def prefetch(self,
+                 image_name: str,
+                 bounding_box: Tuple[int, int, int, int],
+                 threshold: float = 0.8,
+                 timeout: float = 2.0,
+                 levels: int = 3,
+                 method: str = "CCOEFF",
+                 grayscale: bool = True):
+        """
+        Start scanning for an image in the background
+        
+        Args:
+            image_name (str): Name of the template image file
+            bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of search area
+            threshold (float): Minimum confidence threshold for template matching
+            timeout (float): How long to keep scanning for the image (seconds)
+            levels (int): Pyramid levels for the coarse pass (0 for a full resolution search)
+            method (str): Matching method name from MATCH_METHODS ("CCOEFF" or "SQDIFF")
+            grayscale (bool): Match single-channel images
+        """
+        entry = {"done": threading.Event(), "location": None}
+        with self._lock:
+            self._results[image_name] = entry
+        self._requests.put((image_name, bounding_box, threshold, timeout, levels, method, grayscale, entry))
+    
+    def get(self, image_name: str, timeout: float = 2.0) -> Optional[Tuple[int, int]]:
+        """
+        Get the location found by an earlier prefetch
+        
+        Args:
+            image_name (str): Name of the template image file
+            timeout (float): Maximum time to wait for a prefetch that is still scanning
+            
+        Returns:
+            Tuple[int, int]: (x, y) coordinates for mouse click, or None if the image was
+                not prefetched or not found
+        """
+        with self._lock:
+            entry = self._results.pop(image_name, None)
+        if entry is None:
+            return None
+        entry["done"].wait(timeout)
+        return entry["location"]
+    
+    def _run(self):
+        while True:
+            image_name, bounding_box, threshold, timeout, levels, method, grayscale, entry = self._requests.get()
+            deadline = time.time() + timeout
+            location = None
+            while True:
+                location = self.scanner._scan_standard_image(image_name, bounding_box, threshold,
+                                                             pyramid_levels=levels, method=method, grayscale=grayscale)
+                if location is not None or time.time() >= deadline:
+                    break
+                time.sleep(0.05)
+            entry["location"] = location
+            entry["done"].set()
+
+
+# Global prefetch scanner instance
+_prefetch_scanner = None
+
+def get_prefetch_scanner() -> PrefetchScanner:
+    """Get the global prefetch scanner instance"""
+    global _prefetch_scanner
+    if _prefetch_scanner is None:
+        _prefetch_scanner = PrefetchScanner()
+    return _prefetch_scanner
+
+
 # Convenience functions for easy usage
 def scan_for_image(image_name: str, 
                   bounding_box: Tuple[int, int, int, int],
                   threshold: float = 0.8,
                   click_offset: Tuple[int, int] = (0, 0),
                   images_folder: str = "images",
-                  animated_image: bool = False) -> Optional[Tuple[int, int]]:
+                  animated_image: bool = False,
+                  method: str = "CCOEFF",
+                  grayscale: bool = True) -> Optional[Tuple[int, int]]:
     """
     Convenience function to scan for a single image
     
@@ -585,19 +1269,181 @@ def scan_for_image(image_name: str,
         click_offset (Tuple[int, int]): Offset from template center for click position
         images_folder (str): Path to the folder containing template images
         animated_image (bool): If True, uses robust search for animated/transitioning UI elements
+        method (str): Matching method name from MATCH_METHODS ("CCOEFF" or "SQDIFF")
+        grayscale (bool): Match single-channel images
+        
+    Returns:
+        Tuple[int, int]: (x, y) coordinates for mouse click, or None if not found
+    """
+    scanner = ImageScanner(images_folder)
+    return scanner.scan_for_image(image_name, bounding_box, threshold, click_offset, animated_image, method, grayscale)
+
+
+def wait_for_image(image_name: str,
+                   bounding_box: Tuple[int, int, int, int],
+                   timeout: float = 5.0,
+                   interval: float = 0.05,
+                   threshold: float = 0.8,
+                   images_folder: str = "images",
+                   pyramid_levels: int = 0,
+                   method: str = "CCOEFF") -> Optional[Tuple[int, int]]:
+    """
+    Scan for an image repeatedly until it appears, instead of sleeping before a single scan
+    
+    Args:
+        image_name (str): Name of the template image file
+        bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of search area
+        timeout (float): Maximum time to wait (seconds)
+        interval (float): Pause between scans (seconds)
+        threshold (float): Minimum confidence threshold for template matching
+        images_folder (str): Path to the folder containing template images
+        pyramid_levels (int): Find the candidate on a downscaled copy first (0 for a full resolution search)
+        method (str): Template matching method, see MATCH_METHODS
+        
+    Returns:
+        Tuple[int, int]: (x, y) coordinates for mouse click, or None if it never appeared
+    """
+    scanner = ImageScanner(images_folder)
+    
+    # Draw the search region once for the whole wait instead of on every poll
+    x, y, width, height = bounding_box
+    draw_search_region(x, y, x + width, y + height, 
+                      label=f"Waiting for {image_name}", 
+                      color="", enabled=True, auto_hide_seconds=0)
+    
+    deadline = time.time() + timeout
+    while True:
+        last_attempt = time.time() >= deadline
+        # Capture + match only; a coarse miss means "not there yet", so only the last
+        # attempt pays for the full resolution search
+        location = scanner._scan_standard_image(image_name, bounding_box, threshold,
+                                                pyramid_levels=pyramid_levels, method=method, grayscale=True,
+                                                full_fallback=last_attempt)
+        if location or last_attempt:
+            break
+        time.sleep(interval)
+    
+    if location is not None:
+        draw_found_locations([location], color="", enabled=True, auto_hide_seconds=5.0)
+    return location
+
+
+# Click locations of templates that sit at a fixed spot in a fixed-size window, stored as offsets
+# from the search region keyed by "image|width|height" and kept on disk so later runs can reuse them
+_PINNED_COORDS_FILE = os.path.join(os.path.expanduser("~"), ".autoreplay_coords.json")
+_pinned_coords: Optional[Dict[str, list]] = None
+
+
+def _get_pinned_coords() -> Dict[str, list]:
+    """Load the pinned locations file once per process"""
+    global _pinned_coords
+    if _pinned_coords is None:
+        try:
+            with open(_PINNED_COORDS_FILE, "r", encoding="utf-8") as f:
+                _pinned_coords = json.load(f)
+        except (OSError, ValueError):
+            _pinned_coords = {}
+    return _pinned_coords
+
+
+def _pin_key(image_name: str, bounding_box: Tuple[int, int, int, int]) -> str:
+    return f"{image_name}|{bounding_box[2]}|{bounding_box[3]}"
+
+
+def get_pinned_location(image_name: str,
+                        bounding_box: Tuple[int, int, int, int],
+                        threshold: float = 0.8,
+                        images_folder: str = "images") -> Optional[Tuple[int, int]]:
+    """
+    Get a previously pinned location if the template is still there
+    
+    Only a template-sized window around the pinned spot is matched, instead of the whole region.
+    
+    Args:
+        image_name (str): Name of the template image file
+        bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of search area
+        threshold (float): Minimum confidence for the pinned spot to count as a hit
+        images_folder (str): Path to the folder containing template images
+        
+    Returns:
+        Tuple[int, int]: (x, y) coordinates for mouse click, or None if nothing is pinned or it moved
+    """
+    offset = _get_pinned_coords().get(_pin_key(image_name, bounding_box))
+    if offset is None:
+        return None
+    
+    location = (bounding_box[0] + offset[0], bounding_box[1] + offset[1])
+    try:
+        confidence = ImageScanner(images_folder).match_score_around(image_name, location)
+    except Exception as e:
+        print(f"⚠️ Could not verify pinned location of '{image_name}': {e}")
+        return None
+    
+    if confidence < threshold:
+        print(f"ℹ️ Pinned location of '{image_name}' no longer matches ({confidence:.2f})")
+        return None
+    
+    print(f"✅ Image '{image_name}' found at its pinned location (confidence: {confidence:.2f})")
+    return location
+
+
+def pin_image_location(image_name: str, bounding_box: Tuple[int, int, int, int], location: Tuple[int, int]):
+    """
+    Remember where a template was found so get_pinned_location can check just that spot next time
+    
+    Args:
+        image_name (str): Name of the template image file
+        bounding_box (Tuple[int, int, int, int]): (x, y, width, height) the template was searched in
+        location (Tuple[int, int]): Click coordinates returned by the scan (no click offset)
+    """
+    coords = _get_pinned_coords()
+    offset = [location[0] - bounding_box[0], location[1] - bounding_box[1]]
+    key = _pin_key(image_name, bounding_box)
+    if coords.get(key) == offset:
+        return
+    coords[key] = offset
+    try:
+        with open(_PINNED_COORDS_FILE, "w", encoding="utf-8") as f:
+            json.dump(coords, f, indent=2)
+    except OSError as e:
+        print(f"⚠️ Could not save pinned locations: {e}")
+
+
+def scan_for_image_pyramid(image_name: str,
+                          bounding_box: Tuple[int, int, int, int],
+                          threshold: float = 0.8,
+                          levels: int = 3,
+                          click_offset: Tuple[int, int] = (0, 0),
+                          images_folder: str = "images",
+                          method: str = "CCOEFF",
+                          grayscale: bool = True) -> Optional[Tuple[int, int]]:
+    """
+    Convenience function to scan for a single image with pyramid matching
+    
+    Args:
+        image_name (str): Name of the template image file
+        bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of search area
+        threshold (float): Minimum confidence threshold for template matching
+        levels (int): Maximum number of pyramid levels used for the coarse pass
+        click_offset (Tuple[int, int]): Offset from template center for click position
+        images_folder (str): Path to the folder containing template images
+        method (str): Matching method name from MATCH_METHODS ("CCOEFF" or "SQDIFF")
+        grayscale (bool): Match single-channel images
         
     Returns:
         Tuple[int, int]: (x, y) coordinates for mouse click, or None if not found
     """
     scanner = ImageScanner(images_folder)
-    return scanner.scan_for_image(image_name, bounding_box, threshold, click_offset, animated_image)
+    return scanner.scan_for_image_pyramid(image_name, bounding_box, threshold, levels, click_offset, method, grayscale)
 
 
 def scan_for_multiple_images(image_names: list, 
                             bounding_box: Tuple[int, int, int, int],
                             threshold: float = 0.8,
                             images_folder: str = "images",
-                            animated_image: bool = False) -> Dict[str, Tuple[int, int]]:
+                            animated_image: bool = False,
+                            grayscale: bool = True,
+                            pyramid_levels: int = 0) -> Dict[str, Tuple[int, int]]:
     """
     Convenience function to scan for multiple images
     
@@ -607,36 +1453,48 @@ def scan_for_multiple_images(image_names: list,
         threshold (float): Minimum confidence threshold for template matching
         images_folder (str): Path to the folder containing template images
         animated_image (bool): If True, uses robust search for animated/transitioning UI elements
+        grayscale (bool): Match single-channel images (the capture is converted once for all templates)
+        pyramid_levels (int): Find each candidate on a downscaled copy first (0 for a full resolution search)
         
     Returns:
         Dict[str, Tuple[int, int]]: Dictionary mapping image names to click coordinates
     """
     scanner = ImageScanner(images_folder)
-    return scanner.scan_for_multiple_images(image_names, bounding_box, threshold, animated_image)
+    return scanner.scan_for_multiple_images(image_names, bounding_box, threshold, animated_image, grayscale,
+                                            pyramid_levels)
 
 
-def scan_for_all_occurrences(image_name: str, 
+def scan_for_all_occurrences(image_name, 
                             bounding_box: Tuple[int, int, int, int],
                             threshold: float = 0.8,
                             click_offset: Tuple[int, int] = (0, 0),
                             images_folder: str = "images",
-                            animated_image: bool = False) -> list:
+                            animated_image: bool = False,
+                            pyramid_levels: int = 0,
+                            show_overlay: bool = True,
+                            as_array: bool = False,
+                            grayscale: bool = True):
     """
     Convenience function to scan for all occurrences of a single image
     
     Args:
-        image_name (str): Name of the template image file
+        image_name (str | list): Name of the template image file, or a list of variants matched against one capture
         bounding_box (Tuple[int, int, int, int]): (x, y, width, height) of search area
         threshold (float): Minimum confidence threshold for template matching
         click_offset (Tuple[int, int]): Offset from template center for click position
         images_folder (str): Path to the folder containing template images
         animated_image (bool): If True, uses robust search for animated/transitioning UI elements
+        pyramid_levels (int): Find candidates on a downscaled copy first (0 for a full resolution search)
+        show_overlay (bool): Draw the search region and matches; must be False off the main thread
+        as_array (bool): Return an (N, 2) int32 array of x/y columns instead of a list of tuples
+        grayscale (bool): Match single-channel images
         
     Returns:
-        list: List of (x, y) coordinates for all found instances
+        list: List of (x, y) coordinates for all found instances (np.ndarray if as_array)
     """
     scanner = ImageScanner(images_folder)
-    return scanner.scan_for_all_images(image_name, bounding_box, threshold, click_offset, animated_image)
+    return scanner.scan_for_all_images(image_name, bounding_box, threshold, click_offset, animated_image,
+                                       pyramid_levels, show_overlay, as_array, grayscale)
 
 
 def scan_image_with_bbox(automation_helper, image_name: str = "plus-collapsed.png", 
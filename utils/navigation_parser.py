@@ -1,5 +1,36 @@
 import re
-import time
+import logging
+import functools
+
+
+# Compiled once at import time - these are used for every parsed step
+REPEAT_RE = re.compile(r'^(Down|Up|Left|Right|Tab|Enter|Escape)\s+(\d+)$', re.IGNORECASE)
+MENU_NAMES = frozenset(['file', 'edit', 'view', 'format', 'tools', 'help', 'window', 'actions', 'configuration'])
+MODIFIER_NAMES = frozenset(['ctrl', 'alt', 'shift', 'win'])
+
+# Per-step progress lines; errors are still printed
+logger = logging.getLogger(__name__)
+
+# Map common keys to their Windows virtual key codes
+KEY_MAP = {
+    'enter': 0x0D,      # VK_RETURN
+    'escape': 0x1B,     # VK_ESCAPE
+    'tab': 0x09,        # VK_TAB
+    'space': 0x20,      # VK_SPACE
+    'backspace': 0x08,  # VK_BACK
+    'delete': 0x2E,     # VK_DELETE
+    'home': 0x24,       # VK_HOME
+    'end': 0x23,        # VK_END
+    'pageup': 0x21,     # VK_PRIOR
+    'pagedown': 0x22,   # VK_NEXT
+    'up': 0x26,         # VK_UP
+    'down': 0x28,       # VK_DOWN
+    'left': 0x25,       # VK_LEFT
+    'right': 0x27,      # VK_RIGHT
+    'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
+    'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
+    'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B
+}
 
 
 class NavigationParser:
@@ -21,24 +52,32 @@ class NavigationParser:
             List of step dictionaries with 'type' and 'value' keys
         """
         try:
-            print(f"🔍 Parsing navigation: '{navigation_path}'")
-            
-            # Split by arrow notation
-            parts = [part.strip() for part in navigation_path.split('->')]
-            steps = []
-            
-            for part in parts:
-                step = NavigationParser._parse_single_step(part)
-                if step:
-                    steps.append(step)
-                    print(f"  📝 Parsed step: {step}")
-            
-            return steps
+            # The same paths are parsed on every run, so the parsed steps are cached by input string.
+            # Copies are returned so callers can't modify the cached steps.
+            return [dict(step) for step in NavigationParser._parse_navigation_path_cached(navigation_path)]
             
         except Exception as e:
             print(f"⚠️ Error parsing navigation path: {e}")
             return []
     
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_navigation_path_cached(navigation_path):
+        """Parse a navigation path into a tuple of steps (cached)."""
+        logger.debug("🔍 Parsing navigation: '%s'", navigation_path)
+        
+        # Split by arrow notation
+        parts = [part.strip() for part in navigation_path.split('->')]
+        steps = []
+        
+        for part in parts:
+            step = NavigationParser._parse_single_step(part)
+            if step:
+                steps.append(step)
+                logger.debug("  📝 Parsed step: %s", step)
+        
+        return tuple(steps)
+    
     @staticmethod
     def _parse_single_step(step_text):
         """Parse a single navigation step.
@@ -57,8 +96,7 @@ class NavigationParser:
             return NavigationParser._parse_keyboard_code(code_content)
         
         # Check if it's a menu name (common menu names)
-        menu_names = ['file', 'edit', 'view', 'format', 'tools', 'help', 'window', 'actions', 'configuration']
-        if step_text.lower() in menu_names:
+        if step_text.lower() in MENU_NAMES:
             return {
                 'type': 'menu_text',
                 'value': step_text.lower(),
@@ -87,7 +125,7 @@ class NavigationParser:
         code_content = code_content.strip()
         
         # Check for repeat patterns like "Down 3", "Up 2", "Tab 5"
-        repeat_match = re.match(r'^(Down|Up|Left|Right|Tab|Enter|Escape)\s+(\d+)$', code_content, re.IGNORECASE)
+        repeat_match = REPEAT_RE.match(code_content)
         if repeat_match:
             key_name = repeat_match.group(1).lower()
             repeat_count = int(repeat_match.group(2))
@@ -107,7 +145,7 @@ class NavigationParser:
             
             for part in parts:
                 part_lower = part.lower()
-                if part_lower in ['ctrl', 'alt', 'shift', 'win']:
+                if part_lower in MODIFIER_NAMES:
                     modifiers.append(part_lower)
                 else:
                     key = part_lower
@@ -142,37 +180,15 @@ class NavigationParser:
         Returns:
             bool: Success/failure
         """
-        import time  # Ensure time is available
         try:
-            print(f"  🎯 Executing: {step['description']}")
+            logger.debug("  🎯 Executing: %s", step['description'])
             
             if step['type'] == 'key_single':
                 # Single key press using Windows API
                 key_name = step['key'].lower()
                 
-                # Map common keys to their Windows virtual key codes
-                key_map = {
-                    'enter': 0x0D,      # VK_RETURN
-                    'escape': 0x1B,     # VK_ESCAPE
-                    'tab': 0x09,        # VK_TAB
-                    'space': 0x20,      # VK_SPACE
-                    'backspace': 0x08,  # VK_BACK
-                    'delete': 0x2E,     # VK_DELETE
-                    'home': 0x24,       # VK_HOME
-                    'end': 0x23,        # VK_END
-                    'pageup': 0x21,     # VK_PRIOR
-                    'pagedown': 0x22,   # VK_NEXT
-                    'up': 0x26,         # VK_UP
-                    'down': 0x28,       # VK_DOWN
-                    'left': 0x25,       # VK_LEFT
-                    'right': 0x27,      # VK_RIGHT
-                    'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
-                    'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
-                    'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B
-                }
-                
                 # Use automation helper's existing key functionality
-                if key_name in key_map:
+                if key_name in KEY_MAP:
                     # For special keys, create a key combination string
                     key_string = f"{{{step['key']}}}"
                     return automation_helper.keys(key_string)
@@ -193,7 +209,7 @@ class NavigationParser:
                     success = automation_helper.keys(key_string)
                     if not success:
                         return False
-                    time.sleep(0.1)  # Small delay between repeats
+                    automation_helper.wait_idle(timeout_ms=100)  # Let each repeat be handled before the next
                 return True
                 
             elif step['type'] in ['menu_text', 'menu_item_text']:
@@ -210,3 +226,75 @@ class NavigationParser:
             print(f"  ❌ Step execution failed: {e}")
             return False
 
+    @staticmethod
+    def _step_vks(step):
+        """Get the virtual keys for a step that is plain key presses, or None if it needs execute_step_windows."""
+        if step['type'] == 'key_repeat' and step['key'] in KEY_MAP:
+            return [KEY_MAP[step['key']]] * step['count']
+        if step['type'] == 'key_single' and step['key'] in KEY_MAP:
+            return [KEY_MAP[step['key']]]
+        return None
+
+    @staticmethod
+    def execute_steps_windows(steps, automation_helper, settle_ms=200):
+        """Execute parsed navigation steps, batching consecutive plain key presses.
+        
+        Runs of special keys (e.g. "{Down 3} -> {Enter}") are sent with one SendInput call.
+        Only Alt combinations, which open menus, wait for the window to settle afterwards.
+        
+        Args:
+            steps: Step dictionaries from parse_navigation_path
+            automation_helper: ManualAutomationHelper instance
+            settle_ms: Maximum time to wait after a menu-opening step (milliseconds)
+            
+        Returns:
+            bool: Success/failure
+        """
+        pending = []
+        
+        def flush():
+            if not pending:
+                return True
+            success = automation_helper.send_vk_batch(pending)
+            pending.clear()
+            return success
+        
+        for step in steps:
+            vks = NavigationParser._step_vks(step)
+            if vks is not None:
+                logger.debug("  🎯 Queued: %s", step['description'])
+                pending.extend(vks)
+                continue
+            
+            if not flush() or not NavigationParser.execute_step_windows(step, automation_helper):
+                return False
+            if step['type'] == 'key_combination' and 'alt' in step['modifiers']:
+                # Alt menus need a moment to open before the next keys arrive
+                automation_helper.wait_idle(timeout_ms=settle_ms)
+        
+        return flush()
+
+    @staticmethod
+    def navigate(navigation_path, automation_helper):
+        """Parse a navigation path and execute it.
+        
+        Shared by the automation classes so they all use the cached parse and batched execution.
+        
+        Args:
+            navigation_path: Navigation string, e.g. "{Alt+F} -> {Down 1} -> {Enter}",
+                or a step list already returned by parse_navigation_path
+            automation_helper: ManualAutomationHelper instance
+            
+        Returns:
+            bool: Success/failure
+        """
+        if isinstance(navigation_path, str):
+            steps = NavigationParser.parse_navigation_path(navigation_path)
+        else:
+            steps = navigation_path
+        if not steps:
+            print("❌ Failed to parse navigation path")
+            return False
+        
+        # Plain key runs go out as one input batch; only menu-opening steps wait for the window
+        return NavigationParser.execute_steps_windows(steps, automation_helper)
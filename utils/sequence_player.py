@@ -228,7 +228,7 @@ def play_sequence(sequence_name: str, blocking: bool = True,
 
 
 def play_sequence_async(sequence_name: str, on_complete: Optional[Callable] = None,
-                       on_error: Optional[Callable] = None) -> bool:
+                       on_error: Optional[Callable] = None, **kwargs) -> bool:
     """
     Play a sequence asynchronously (non-blocking).
     
@@ -236,11 +236,12 @@ def play_sequence_async(sequence_name: str, on_complete: Optional[Callable] = No
         sequence_name: Name of sequence to play
         on_complete: Callback for successful completion
         on_error: Callback for errors
+        **kwargs: Parameters passed to the sequence's replay function (e.g. project_name)
         
     Returns:
         bool: True if started successfully
     """
-    return play_sequence(sequence_name, blocking=False, on_complete=on_complete, on_error=on_error)
+    return play_sequence(sequence_name, blocking=False, on_complete=on_complete, on_error=on_error, **kwargs)
 
 
 def play_sequence_with_delay(sequence_name: str, delay_seconds: float, 
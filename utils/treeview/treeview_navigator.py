@@ -7,14 +7,17 @@ import time
 import sys
 import os
 from typing import List, Optional
+import win32gui
 
 # Add parent directory to path for imports when running directly
 if __name__ == "__main__":
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from windows_automation import ManualAutomationHelper
+    from windows_automation import ManualAutomationHelper, wait_for
+    from image_scanner import ImageScanner
     from treeview_path_computer import TreeviewPathComputer
 else:
-    from ..windows_automation import ManualAutomationHelper
+    from ..windows_automation import ManualAutomationHelper, wait_for
+    from ..image_scanner import ImageScanner
     from .treeview_path_computer import TreeviewPathComputer
 
 
@@ -24,6 +27,14 @@ class TreeViewNavigator:
     Uses TreeviewPathComputer for logic and executes the key sequences.
     """
     
+    # Longest wait for the tree to handle each key; the wait ends once the tree has visibly changed and settled
+    KEY_SETTLE_MS = {
+        "Right": 1000,  # Expansion needs more time
+        "Up": 100,      # Sibling navigation
+        "Down": 100,
+        "Left": 300,    # Collapse needs moderate time
+    }
+    
     def __init__(self, automation_helper: ManualAutomationHelper = None, window_title: str = None, collapse_count: int = 1):
         """
         Initialize the navigator for a specific window containing a treeview.
@@ -38,6 +49,7 @@ class TreeViewNavigator:
         self.collapse_count = collapse_count  # How many left arrows for collapse
         self.path_computer = TreeviewPathComputer()
         self.first_navigation = True  # Flag to track if this is the first navigation
+        self.scanner = ImageScanner()
         
         if automation_helper is None and window_title:
             self.connect_to_window(window_title)
@@ -78,6 +90,11 @@ class TreeViewNavigator:
             }
             
             formatted_key = key_map.get(key, key)
+            
+            # Snapshot the tree before the key so the wait below can tell when it has been handled
+            region = self.automation.get_focused_region() if delay is None and key in self.KEY_SETTLE_MS else None
+            before = self.scanner.region_digest(region) if region else None
+            
             success = self.automation.keys(formatted_key)
             
             if success:
@@ -86,12 +103,9 @@ class TreeViewNavigator:
             # Apply delay based on key type
             if delay is not None:
                 time.sleep(delay)
-            elif key == "Right":
-                time.sleep(1)  # Expansion needs more time
-            elif key in ["Up", "Down"]:
-                time.sleep(0.1)  # Sibling navigation
-            elif key == "Left":
-                time.sleep(0.3)  # Collapse needs moderate time
+            elif region:
+                # A key that changes nothing (e.g. Right on a leaf) waits the full settle time
+                self.scanner.wait_region_change(region, before, timeout=self.KEY_SETTLE_MS[key] / 1000.0)
             
             return success
         except Exception as e:
@@ -133,7 +147,7 @@ class TreeViewNavigator:
             print(f"📝 Key sequence: {key_sequence}")
             
             # Allow window to properly gain focus
-            time.sleep(0.3)
+            wait_for(lambda: win32gui.GetForegroundWindow() == self.automation.hwnd, timeout=0.3)
             
             # Execute key sequence, handling collapse_count for Left keys
             for i, key in enumerate(key_sequence):
@@ -0,0 +1,42 @@
+"""
+Fast top-level window lookup using EnumWindows through ctypes.
+Stops enumerating at the first match instead of collecting every window title first.
+"""
+import ctypes
+from ctypes import wintypes
+from typing import Optional
+
+user32 = ctypes.windll.user32
+
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+
+def find_window_by_title(title: str, starts_with: bool = False) -> Optional[int]:
+    """
+    Find the first visible top-level window matching a title.
+    
+    Args:
+        title: Window title to look for
+        starts_with: Match titles that start with the given text (case-insensitive)
+                     instead of requiring an exact match
+        
+    Returns:
+        int: Window handle, or None if no window matches
+    """
+    prefix = title.lower()
+    found = []
+    buffer = ctypes.create_unicode_buffer(512)
+    
+    def callback(hwnd, lparam):
+        if not user32.IsWindowVisible(hwnd):
+            return True
+        if not user32.GetWindowTextW(hwnd, buffer, len(buffer)):
+            return True
+        window_title = buffer.value
+        if (window_title.lower().startswith(prefix) if starts_with else window_title == title):
+            found.append(hwnd)
+            return False  # Stop enumerating
+        return True
+    
+    user32.EnumWindows(WNDENUMPROC(callback), 0)
+    return found[0] if found else None
@@ -4,16 +4,505 @@ Windows automation utilities for targeting and controlling specific windows
 Provides functionality to find windows, bring them to focus, and perform automation tasks
 """
 import time
+import threading
+import ctypes
+from ctypes import wintypes
 import win32gui
 import win32api
 import win32con
+import win32clipboard
+import pywintypes
 from typing import List, Tuple, Optional
 
+from utils.win32_find import find_window_by_title
 
-def list_all_windows() -> List[Tuple[int, str]]:
+
+class GUITHREADINFO(ctypes.Structure):
+    """Mirror of the Win32 GUITHREADINFO structure used by GetGUIThreadInfo."""
+    _fields_ = [
+        ('cbSize', wintypes.DWORD),
+        ('flags', wintypes.DWORD),
+        ('hwndActive', wintypes.HWND),
+        ('hwndFocus', wintypes.HWND),
+        ('hwndCapture', wintypes.HWND),
+        ('hwndMenuOwner', wintypes.HWND),
+        ('hwndMoveSize', wintypes.HWND),
+        ('hwndCaret', wintypes.HWND),
+        ('rcCaret', wintypes.RECT),
+    ]
+
+
+def get_focused_hwnd(hwnd: Optional[int] = None) -> Optional[int]:
+    """
+    Get the handle of the control that currently has keyboard focus.
+    
+    Uses GetGUIThreadInfo, which also works for controls owned by other
+    processes (unlike GetFocus).
+    
+    Args:
+        hwnd: Look at the UI thread owning this window instead of the foreground thread
+    
+    Returns:
+        int: Handle of the focused control, or None if it cannot be determined
+    """
+    info = GUITHREADINFO()
+    info.cbSize = ctypes.sizeof(GUITHREADINFO)
+    thread_id = ctypes.windll.user32.GetWindowThreadProcessId(hwnd, None) if hwnd else 0
+    if not ctypes.windll.user32.GetGUIThreadInfo(thread_id, ctypes.byref(info)):
+        return None
+    return info.hwndFocus or None
+
+
+def wait_for(predicate, timeout: float = 1.5, poll: float = 0.02) -> bool:
+    """
+    Poll a readiness check until it passes instead of sleeping a fixed amount.
+    The worst case is the same as the old fixed sleep, but a ready UI returns within one poll.
+    
+    Args:
+        predicate: Callable returning a truthy value once the UI is ready
+        timeout: Maximum time to wait (seconds)
+        poll: How often to call the predicate (seconds)
+        
+    Returns:
+        bool: True if the predicate passed, False if the timeout was reached
+    """
+    deadline = time.time() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(poll)
+
+
+# SendInput structures - the union must include MOUSEINPUT so INPUT has the size Windows expects
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+# SendMessageTimeout flags used to probe whether a window's UI thread is idle
+SMTO_BLOCK = 0x0001
+SMTO_ABORTIFHUNG = 0x0002
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ('dx', wintypes.LONG),
+        ('dy', wintypes.LONG),
+        ('mouseData', wintypes.DWORD),
+        ('dwFlags', wintypes.DWORD),
+        ('time', wintypes.DWORD),
+        ('dwExtraInfo', ctypes.c_size_t),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ('wVk', wintypes.WORD),
+        ('wScan', wintypes.WORD),
+        ('dwFlags', wintypes.DWORD),
+        ('time', wintypes.DWORD),
+        ('dwExtraInfo', ctypes.c_size_t),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ('uMsg', wintypes.DWORD),
+        ('wParamL', wintypes.WORD),
+        ('wParamH', wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [
+        ('mi', MOUSEINPUT),
+        ('ki', KEYBDINPUT),
+        ('hi', HARDWAREINPUT),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ('u',)
+    _fields_ = [
+        ('type', wintypes.DWORD),
+        ('u', _INPUTUNION),
+    ]
+
+
+def _send_inputs(entries: List[INPUT]) -> int:
+    """Send a list of INPUT entries with a single SendInput call."""
+    if not entries:
+        return 0
+    array = (INPUT * len(entries))(*entries)
+    return ctypes.windll.user32.SendInput(len(entries), array, ctypes.sizeof(INPUT))
+
+
+def _vk_inputs(vk: int) -> List[INPUT]:
+    """Build the key down/up INPUT pair for a virtual key."""
+    return [
+        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=vk, dwFlags=0)),
+        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=vk, dwFlags=KEYEVENTF_KEYUP)),
+    ]
+
+
+def _unicode_inputs(text: str) -> List[INPUT]:
+    """Build KEYEVENTF_UNICODE down/up INPUT pairs for every UTF-16 code unit of text."""
+    entries = []
+    encoded = text.encode('utf-16-le')
+    for i in range(0, len(encoded), 2):
+        code_unit = int.from_bytes(encoded[i:i + 2], 'little')
+        entries.append(INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=0, wScan=code_unit, dwFlags=KEYEVENTF_UNICODE)))
+        entries.append(INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=0, wScan=code_unit,
+                                                                dwFlags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP)))
+    return entries
+
+
+def send_vk_batch(vks: List[int]) -> bool:
+    """
+    Press and release a list of virtual keys with one SendInput call.
+    Windows queues the events in order, so no per-key delay is needed.
+
+    Args:
+        vks: Virtual key codes to press, in order (e.g. [VK_TAB, VK_TAB, VK_SPACE])
+
+    Returns:
+        bool: True if every event was inserted into the input stream
+    """
+    entries = []
+    for vk in vks:
+        entries.extend(_vk_inputs(vk))
+    return _send_inputs(entries) == len(entries)
+
+
+def send_click(x: int, y: int) -> bool:
+    """
+    Move the cursor and send a left click as a single input burst.
+    The button down/up pair goes through one SendInput call right after the cursor move,
+    so no delay is needed between positioning and clicking.
+
+    Args:
+        x: Screen x coordinate
+        y: Screen y coordinate
+
+    Returns:
+        bool: True if both button events were inserted into the input stream
+    """
+    win32api.SetCursorPos((x, y))
+    entries = [
+        INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dwFlags=win32con.MOUSEEVENTF_LEFTDOWN)),
+        INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dwFlags=win32con.MOUSEEVENTF_LEFTUP)),
+    ]
+    return _send_inputs(entries) == len(entries)
+
+
+# The target reads the clipboard only when it handles Ctrl+V, so the user's clipboard is put back
+# after this delay; a paste in the meantime postpones the restore and keeps the originally saved data
+CLIPBOARD_RESTORE_DELAY = 0.5
+_clipboard_lock = threading.Lock()
+_clipboard_restore = None  # (timer, saved formats, token) of the pending restore
+
+
+def _open_clipboard(retries: int = 10, delay: float = 0.02):
+    """Open the clipboard, retrying while another application holds it."""
+    for attempt in range(retries):
+        try:
+            win32clipboard.OpenClipboard()
+            return
+        except pywintypes.error:
+            if attempt == retries - 1:
+                raise
+            time.sleep(delay)
+
+
+def _save_clipboard() -> dict:
+    """Read every clipboard format that comes back as data (handle-only formats are skipped). Clipboard must be open."""
+    saved = {}
+    fmt = win32clipboard.EnumClipboardFormats(0)
+    while fmt:
+        try:
+            data = win32clipboard.GetClipboardData(fmt)
+            if isinstance(data, (str, bytes)):
+                saved[fmt] = data
+        except pywintypes.error:
+            pass
+        fmt = win32clipboard.EnumClipboardFormats(fmt)
+    return saved
+
+
+def _restore_clipboard(token):
+    """Put the saved clipboard data back, unless a newer paste has taken over."""
+    global _clipboard_restore
+    with _clipboard_lock:
+        if _clipboard_restore is None or _clipboard_restore[2] is not token:
+            return
+        saved = _clipboard_restore[1]
+        _clipboard_restore = None
+        try:
+            _open_clipboard()
+        except pywintypes.error as e:
+            print(f"Warning: Could not restore the clipboard: {e}")
+            return
+        try:
+            win32clipboard.EmptyClipboard()
+            for fmt, data in saved.items():
+                try:
+                    win32clipboard.SetClipboardData(fmt, data)
+                except pywintypes.error:
+                    pass
+        finally:
+            win32clipboard.CloseClipboard()
+
+
+def paste_text(text: str) -> bool:
+    """
+    Put text on the clipboard and paste it with Ctrl+V.
+    One keystroke regardless of the text length, instead of one key event per character.
+    The previous clipboard contents are restored CLIPBOARD_RESTORE_DELAY seconds later.
+
+    Args:
+        text: Text to paste into the focused control
+
+    Returns:
+        bool: True if the paste keystroke was inserted into the input stream
+    """
+    global _clipboard_restore
+    with _clipboard_lock:
+        _open_clipboard()
+        try:
+            if _clipboard_restore is not None:
+                # The clipboard still holds an earlier paste - keep what the user had before that
+                timer, saved, _ = _clipboard_restore
+                timer.cancel()
+            else:
+                saved = _save_clipboard()
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+        finally:
+            win32clipboard.CloseClipboard()
+        
+        token = object()
+        timer = threading.Timer(CLIPBOARD_RESTORE_DELAY, _restore_clipboard, args=(token,))
+        timer.daemon = True
+        _clipboard_restore = (timer, saved, token)
+        timer.start()
+    
+    entries = [
+        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=win32con.VK_CONTROL, dwFlags=0)),
+        *_vk_inputs(ord('V')),
+        INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=win32con.VK_CONTROL, dwFlags=KEYEVENTF_KEYUP)),
+    ]
+    return _send_inputs(entries) == len(entries)
+
+
+def send_unicode_text(text: str) -> bool:
+    """
+    Type text as unicode key events with one SendInput call.
+
+    Args:
+        text: Text to type into the focused control
+
+    Returns:
+        bool: True if every event was inserted into the input stream
+    """
+    entries = _unicode_inputs(text)
+    return _send_inputs(entries) == len(entries)
+
+
+def replace_selection_in_edit(hwnd: int, text: str) -> bool:
+    """
+    Insert text at the caret of an edit control with EM_REPLACESEL.
+    Same result as typing it, but in a single message.
+
+    Args:
+        hwnd: Handle of an Edit/RichEdit control
+        text: Text to insert
+
+    Returns:
+        bool: True if the message was delivered
+    """
+    result = ctypes.c_size_t()
+    return bool(ctypes.windll.user32.SendMessageTimeoutW(hwnd, win32con.EM_REPLACESEL, True, ctypes.c_wchar_p(text),
+                                                         SMTO_ABORTIFHUNG, 1000, ctypes.byref(result)))
+
+
+def fill_fields(values: List[str], tabs_between: int = 2, trailing_tabs: int = 0) -> bool:
+    """
+    Type a list of field values separated by Tab presses with one SendInput call.
+    Text is sent as unicode events, so no keyboard layout lookup or per-character delay is needed.
+
+    Args:
+        values: Text for each field, in tab order (empty strings leave a field untouched)
+        tabs_between: Number of Tab presses between consecutive fields
+        trailing_tabs: Number of Tab presses after the last field
+
+    Returns:
+        bool: True if every event was inserted into the input stream
+    """
+    entries = []
+    for i, value in enumerate(values):
+        entries.extend(_unicode_inputs(value))
+        tab_count = trailing_tabs if i == len(values) - 1 else tabs_between
+        for _ in range(tab_count):
+            entries.extend(_vk_inputs(win32con.VK_TAB))
+    return _send_inputs(entries) == len(entries)
+
+
+# WinEvent hook constants for tracking top-level windows as they are created/destroyed
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_SHOW = 0x8002
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+GA_ROOT = 2
+
+WinEventProcType = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+
+
+class WindowEventWatcher:
+    """
+    Keeps a title -> hwnd map of top-level windows up to date from WinEvent notifications,
+    so new dialogs can be picked up when they appear instead of re-enumerating all windows.
+    """
+    
+    def __init__(self):
+        self._windows = {}  # hwnd -> title
+        self._changed = threading.Condition()
+        self._thread = None
+        self._thread_id = None
+        # Keep a reference to the callback so it is not garbage collected while hooked
+        self._callback = WinEventProcType(self._on_event)
+    
+    def start(self):
+        """Install the hook on a background thread that pumps its messages."""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        # Seed with the windows that are already open
+        with self._changed:
+            self._windows = dict(list_all_windows())
+        
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+        self._thread.start()
+        ready.wait(1.0)
+    
+    def stop(self):
+        """Remove the hook and stop the message loop."""
+        if self._thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, win32con.WM_QUIT, 0, 0)
+            self._thread_id = None
+    
+    def _run(self, ready):
+        user32 = ctypes.windll.user32
+        self._thread_id = win32api.GetCurrentThreadId()
+        # CREATE..SHOW also covers DESTROY; titles are usually only set by the time the window is shown
+        hook = user32.SetWinEventHook(EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, 0, self._callback, 0, 0,
+                                      WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS)
+        ready.set()
+        if not hook:
+            print("❌ Failed to install window event hook")
+            return
+        
+        # Out-of-context hooks are delivered through this thread's message queue
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+        user32.UnhookWinEvent(hook)
+    
+    def _on_event(self, hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        # Only whole top-level windows are interesting, not the controls inside them
+        if id_object != OBJID_WINDOW or id_child != 0 or not hwnd:
+            return
+        try:
+            with self._changed:
+                if event == EVENT_OBJECT_DESTROY:
+                    self._windows.pop(hwnd, None)
+                elif ctypes.windll.user32.GetAncestor(hwnd, GA_ROOT) == hwnd:
+                    title = win32gui.GetWindowText(hwnd)
+                    if title:
+                        self._windows[hwnd] = title
+                self._changed.notify_all()
+        except Exception as e:
+            print(f"Error handling window event: {e}")
+    
+    def _find(self, title: str, starts_with: bool) -> Optional[int]:
+        for hwnd, window_title in list(self._windows.items()):
+            matches = window_title.startswith(title) if starts_with else window_title == title
+            if matches and win32gui.IsWindow(hwnd):
+                return hwnd
+        return None
+    
+    def wait_for_window(self, title: str, timeout: float = 2.0, starts_with: bool = False) -> Optional[int]:
+        """
+        Wait for a top-level window with the given title to appear.
+        
+        Args:
+            title: Exact window title (or prefix when starts_with is True)
+            timeout: Maximum time to wait (seconds)
+            starts_with: Match windows whose title starts with the given text
+            
+        Returns:
+            int: Window handle, or None if no such window appeared in time
+        """
+        deadline = time.time() + timeout
+        with self._changed:
+            while True:
+                hwnd = self._find(title, starts_with)
+                if hwnd:
+                    return hwnd
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+        
+        # The hook may have missed a title change, fall back to a single enumeration
+        if starts_with:
+            return find_window_by_title(title, starts_with=True)
+        return win32gui.FindWindow(None, title) or None
+
+
+# Global window watcher instance
+_window_watcher = None
+_window_watcher_lock = threading.Lock()
+
+def get_window_watcher() -> WindowEventWatcher:
+    """Get the global window watcher, starting it on first use"""
+    global _window_watcher
+    if _window_watcher is None:
+        # Callers racing a background start wait here until the hook is installed,
+        # instead of installing a second hook or getting a watcher that is not ready yet
+        with _window_watcher_lock:
+            if _window_watcher is None:
+                watcher = WindowEventWatcher()
+                watcher.start()
+                _window_watcher = watcher
+    return _window_watcher
+
+
+def stop_window_watcher():
+    """Stop the global window watcher if one was started"""
+    global _window_watcher
+    with _window_watcher_lock:
+        if _window_watcher is not None:
+            _window_watcher.stop()
+            _window_watcher = None
+
+
+def list_all_windows(title_filter=None) -> List[Tuple[int, str]]:
     """
     List all visible windows with their handles and titles.
     
+    Args:
+        title_filter: Optional callable taking a title and returning True to keep the window;
+                      applied during enumeration so non-matching windows are never collected
+    
     Returns:
         List[Tuple[int, str]]: List of (window_handle, target_window_title) tuples
     """
@@ -22,7 +511,8 @@ def list_all_windows() -> List[Tuple[int, str]]:
     def enum_handler(hwnd, results):
         if win32gui.IsWindowVisible(hwnd):
             target_window_title = win32gui.GetWindowText(hwnd)
-            if target_window_title:  # Only include windows with titles
+            # Only include windows with titles
+            if target_window_title and (title_filter is None or title_filter(target_window_title)):
                 results.append((hwnd, target_window_title))
     
     win32gui.EnumWindows(enum_handler, windows)
@@ -39,14 +529,8 @@ def find_windows_by_title(partial_title: str) -> List[Tuple[int, str]]:
     Returns:
         List[Tuple[int, str]]: List of matching (window_handle, target_window_title) tuples
     """
-    all_windows = list_all_windows()
-    matching_windows = []
-    
-    for hwnd, title in all_windows:
-        if partial_title.lower() in title.lower():
-            matching_windows.append((hwnd, title))
-    
-    return matching_windows
+    needle = partial_title.lower()
+    return list_all_windows(lambda title: needle in title.lower())
 
 
 def find_windows_by_title_starts_with(prefix: str) -> List[Tuple[int, str]]:
@@ -60,14 +544,8 @@ def find_windows_by_title_starts_with(prefix: str) -> List[Tuple[int, str]]:
     Returns:
         List[Tuple[int, str]]: List of matching (window_handle, target_window_title) tuples
     """
-    all_windows = list_all_windows()
-    matching_windows = []
-    
-    for hwnd, title in all_windows:
-        if title.lower().startswith(prefix.lower()):
-            matching_windows.append((hwnd, title))
-    
-    return matching_windows
+    prefix = prefix.lower()
+    return list_all_windows(lambda title: title.lower().startswith(prefix))
 
 
 def get_window_info(hwnd: int) -> Optional[dict]:
@@ -153,6 +631,9 @@ def get_window_info(hwnd: int) -> Optional[dict]:
 
 
 class ManualAutomationHelper:
+    # Handles found by title, keyed by (title, title_starts_with); checked before reuse since windows come and go
+    _hwnd_cache = {}
+    
     def __init__(self, window_handle=None, target_window_title=None, title_starts_with=False):
         """
         Initialize the helper with window information.
@@ -164,14 +645,7 @@ class ManualAutomationHelper:
         if window_handle:
             self.hwnd = window_handle
         elif target_window_title:
-            if title_starts_with:
-                windows = find_windows_by_title_starts_with(target_window_title)
-                if windows:
-                    self.hwnd = windows[0][0]  # Extract handle from first tuple
-                else:
-                    self.hwnd = None
-            else:
-                self.hwnd = win32gui.FindWindow(None, target_window_title)
+            self.hwnd = self._find_window_cached(target_window_title, title_starts_with)
             if not self.hwnd:
                 raise ValueError(f"Window not found: '{target_window_title}'")
         else:
@@ -179,10 +653,39 @@ class ManualAutomationHelper:
         
         self.target_window_title = target_window_title or self._get_target_window_title()
         
+        # Window details only change when the window is moved through this helper
+        self._window_info = None
+        
         # Initialize bbox with current window rect as default
         self._bring_to_focus()
         self._initialize_default_bbox()
     
+    @classmethod
+    def _find_window_cached(cls, title, starts_with=False):
+        """
+        Find a top-level window by title, reusing the handle found by an earlier helper.
+        
+        Returns:
+            int: Window handle, or None if no such window exists
+        """
+        key = (title, starts_with)
+        hwnd = cls._hwnd_cache.get(key)
+        if hwnd and win32gui.IsWindow(hwnd):
+            current_title = win32gui.GetWindowText(hwnd)
+            if current_title == title or (starts_with and current_title.startswith(title)):
+                return hwnd
+        
+        if starts_with:
+            # Stops at the first match instead of listing every window title
+            hwnd = find_window_by_title(title, starts_with=True)
+        else:
+            hwnd = win32gui.FindWindow(None, title)
+        if hwnd:
+            cls._hwnd_cache[key] = hwnd
+        else:
+            cls._hwnd_cache.pop(key, None)
+        return hwnd or None
+    
     def _get_target_window_title(self):
         """Get window title from handle."""
         try:
@@ -218,10 +721,37 @@ class ManualAutomationHelper:
             bottom: Bottom coordinate
         """
         self.bbox = (left, top, right, bottom)
+        self._window_info = None
         print(f"Bbox updated to: {self.bbox}")
     
+    def get_focused_region(self):
+        """
+        Get the screen region of the control focused in this window, falling back to the whole window.
+        
+        Returns:
+            tuple: (x, y, width, height) for image scanning, or None if the window is gone
+        """
+        hwnd = get_focused_hwnd(self.hwnd) or self.hwnd
+        try:
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+        except win32gui.error:
+            return None
+        if right <= left or bottom <= top:
+            return None
+        return (left, top, right - left, bottom - top)
+    
     def get_bbox(self):
-        """Get the current bounding box."""
+        """
+        Get the current bounding box.
+        This is the cached value, kept up to date by setup_window/set_bbox/move_window;
+        call invalidate_bbox() if the window was moved by something else.
+        """
+        return self.bbox
+    
+    def invalidate_bbox(self):
+        """Re-read the bounding box and window details after the window was moved externally."""
+        self._window_info = None
+        self._initialize_default_bbox()
         return self.bbox
     
     def get_bbox_dimensions(self):
@@ -345,6 +875,7 @@ class ManualAutomationHelper:
             if bbox is not None:
                 if len(bbox) == 4:
                     self.bbox = bbox
+                    self._window_info = None
                     print(f"✅ Bbox updated to: {self.bbox}")
                 else:
                     print("⚠️ Warning: Invalid bbox format. Expected (left, top, right, bottom)")
@@ -378,14 +909,18 @@ class ManualAutomationHelper:
             print(f"❌ Error setting up window: {e}")
             return False
             
-    def type(self, text, hwnd=None, speed=0.01):
+    def type(self, text, hwnd=None, speed=0.01, direct=False):
         """
         Type text into the focused window.
         
         Args:
             text: Text string to type
             hwnd: Window handle (optional)
-            speed: Delay between characters in seconds (default: 0.2)
+            speed: Delay between characters in seconds (default: 0.01, 0 sends all characters at once)
+            direct: Insert the whole string into a focused Edit control with one EM_REPLACESEL message.
+                The message overtakes key input that is still queued (e.g. a preceding {tab}) and
+                produces no key events for fields that validate on them, so only use it when the
+                focus is known to be settled on a plain edit field
             
         Returns:
             bool: Success status
@@ -394,6 +929,17 @@ class ManualAutomationHelper:
             # Bring window to focus
             self._bring_to_focus(hwnd)
             
+            # Edit controls (including WinForms/RichEdit ones) take the whole string in one message
+            if direct:
+                focused = get_focused_hwnd()
+                if focused and 'edit' in win32gui.GetClassName(focused).lower():
+                    if replace_selection_in_edit(focused, text):
+                        return True
+            
+            # No per-character delay requested - send every character in one batch
+            if speed <= 0:
+                return send_unicode_text(text)
+            
             # Type each character
             for char in text:
                 # Get virtual key code for character
@@ -442,15 +988,8 @@ class ManualAutomationHelper:
             
             x, y = coordinate
             
-            # Move cursor to position
-            win32api.SetCursorPos((x, y))
-            time.sleep(0.1)
-            
-            # Perform left click
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, x, y, 0, 0)
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, x, y, 0, 0)
-            
-            return True
+            # Move cursor to position and perform left click in one burst
+            return send_click(x, y)
             
         except Exception as e:
             print(f"Error clicking at {coordinate}: {e}")
@@ -528,6 +1067,150 @@ class ManualAutomationHelper:
             print(f"Error sending keys '{key_combination}': {e}")
             return False
     
+    def keys_batch(self, tokens, hwnd=None):
+        """
+        Send several key tokens with a single SendInput call.
+        
+        Args:
+            tokens: List of tokens in keys() notation, e.g. ["{tab}", "{tab}", "{Ctrl+A}", "text"].
+                    Braced tokens are keys (with optional modifiers), anything else is typed as text.
+            hwnd: Window handle (optional)
+            
+        Returns:
+            bool: Success status
+        """
+        modifier_vks = {'ctrl': win32con.VK_CONTROL, 'alt': win32con.VK_MENU,
+                        'shift': win32con.VK_SHIFT, 'win': win32con.VK_LWIN}
+        try:
+            entries = []
+            for token in tokens:
+                if not (token.startswith('{') and token.endswith('}')):
+                    entries.extend(_unicode_inputs(token))
+                    continue
+                
+                parts = [part.strip() for part in token[1:-1].split('+')]
+                modifiers = [modifier_vks[part.lower()] for part in parts[:-1]]
+                main_vk = self._get_virtual_key_code(parts[-1])
+                if not main_vk:
+                    print(f"Unknown key in batch: '{token}'")
+                    return False
+                
+                for vk in modifiers:
+                    entries.append(INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=vk, dwFlags=0)))
+                entries.extend(_vk_inputs(main_vk))
+                for vk in reversed(modifiers):
+                    entries.append(INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=vk, dwFlags=KEYEVENTF_KEYUP)))
+            
+            self._bring_to_focus(hwnd)
+            return _send_inputs(entries) == len(entries)
+        except Exception as e:
+            print(f"Error sending key batch {tokens}: {e}")
+            return False
+
+    def keys_post(self, tokens, hwnd=None):
+        """
+        Post a single key token straight to the focused control's message queue.
+        Unlike SendInput this does not need the window in the foreground, so no focus
+        switch (and its settle sleeps) is done.
+        
+        Only one token is posted: every message goes to the control focused now, so a second
+        token after a {tab} would still reach the old control. Several tokens, tokens with
+        modifiers (menu accelerators like {Alt+F} need real WM_SYSKEY* input) and windows
+        without a focused control are sent with keys_batch instead.
+        
+        Args:
+            tokens: List of tokens in keys() notation, e.g. ["{space}"]
+            hwnd: Window handle (optional)
+            
+        Returns:
+            bool: Success status
+        """
+        if len(tokens) != 1 or any('+' in token for token in tokens if token.startswith('{')):
+            return self.keys_batch(tokens, hwnd)
+        
+        window = hwnd or self.hwnd
+        if not (target := get_focused_hwnd(window)):
+            return self.keys_batch(tokens, hwnd)
+        post = ctypes.windll.user32.PostMessageW
+        try:
+            for token in tokens:
+                if not (token.startswith('{') and token.endswith('}')):
+                    for char in token:
+                        post(target, win32con.WM_CHAR, ord(char), 1)
+                    continue
+                
+                vk = self._get_virtual_key_code(token[1:-1].strip())
+                if not vk:
+                    print(f"Unknown key to post: '{token}'")
+                    return False
+                # lParam: repeat count 1, scan code in bits 16-23; key up also sets the previous-state and transition bits
+                scan_code = ctypes.windll.user32.MapVirtualKeyW(vk, 0)
+                down_lparam = 1 | (scan_code << 16)
+                up_lparam = down_lparam | (1 << 30) | (1 << 31)
+                if not (post(target, win32con.WM_KEYDOWN, vk, down_lparam) and
+                        post(target, win32con.WM_KEYUP, vk, up_lparam)):
+                    return False
+            return True
+        except Exception as e:
+            print(f"Error posting keys {tokens}: {e}")
+            return False
+
+    def send_vk_batch(self, vks, hwnd=None):
+        """
+        Send a sequence of virtual keys to the window in a single SendInput batch.
+
+        Args:
+            vks: List of virtual key codes, each pressed and released in order
+            hwnd: Window handle (optional)
+
+        Returns:
+            bool: Success status
+        """
+        try:
+            self._bring_to_focus(hwnd)
+            return send_vk_batch(vks)
+        except Exception as e:
+            print(f"Error sending key batch {vks}: {e}")
+            return False
+
+    def paste_text(self, text, hwnd=None):
+        """
+        Paste text into the focused window through the clipboard.
+        
+        Args:
+            text: Text string to paste
+            hwnd: Window handle (optional)
+            
+        Returns:
+            bool: Success status
+        """
+        try:
+            self._bring_to_focus(hwnd)
+            return paste_text(text)
+        except Exception as e:
+            print(f"Error pasting text '{text}': {e}")
+            return False
+    
+    def fill_fields(self, values, tabs_between=2, trailing_tabs=0, hwnd=None):
+        """
+        Fill consecutive text fields in a single SendInput batch.
+
+        Args:
+            values: Text for each field, in tab order
+            tabs_between: Number of Tab presses between consecutive fields
+            trailing_tabs: Number of Tab presses after the last field
+            hwnd: Window handle (optional)
+
+        Returns:
+            bool: Success status
+        """
+        try:
+            self._bring_to_focus(hwnd)
+            return fill_fields(values, tabs_between, trailing_tabs)
+        except Exception as e:
+            print(f"Error filling fields {values}: {e}")
+            return False
+
     def _get_virtual_key_code(self, key_name):
         """Get virtual key code for special keys."""
         special_keys = {
@@ -572,9 +1255,17 @@ class ManualAutomationHelper:
         
         return None
     
-    def get_window_info(self):
-        """Get detailed information about the target window."""
-        return get_window_info(self.hwnd)
+    def get_window_info(self, refresh=False):
+        """
+        Get detailed information about the target window.
+        The result is cached until the window is moved through this helper.
+        
+        Args:
+            refresh: Query the window again instead of using the cached details
+        """
+        if refresh or self._window_info is None:
+            self._window_info = get_window_info(self.hwnd)
+        return self._window_info
     
     def is_window_valid(self):
         """Check if the window handle is still valid."""
@@ -606,6 +1297,8 @@ class ManualAutomationHelper:
         """
         try:
             win32gui.MoveWindow(self.hwnd, x, y, width, height, True)
+            self.bbox = (x, y, x + width, y + height)
+            self._window_info = None
             return True
         except Exception as e:
             print(f"Error moving window: {e}")
@@ -683,6 +1376,73 @@ class ManualAutomationHelper:
             print(f"❌ Error in wait_for_ui_change: {e}")
             return True  # Continue anyway
     
+    def wait_for_focus_change(self, previous_focus, timeout: float = 0.5, poll_interval: float = 0.02):
+        """
+        Wait until keyboard focus moves away from a previously focused control.
+        Returns as soon as the change is seen instead of sleeping a fixed amount.
+        The first check is immediate and the pause between checks doubles up to
+        poll_interval, so fast UIs cost almost nothing and slow ones are not polled hard.
+
+        Args:
+            previous_focus: Handle of the control focused before the key was sent
+            timeout: Maximum time to wait for the focus change (seconds)
+            poll_interval: Longest pause between checks of the focused control (seconds)
+
+        Returns:
+            bool: True if focus changed, False if the timeout was reached
+        """
+        deadline = time.time() + timeout
+        delay = 0.001
+        while True:
+            if get_focused_hwnd() != previous_focus:
+                return True
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, poll_interval)
+
+    def wait_idle(self, timeout_ms: int = 1000, probe_ms: int = 50, hwnd=None, min_ms: int = 0):
+        """
+        Wait until the window's UI thread is responsive, i.e. not busy in a long handler.
+        A WM_NULL sent with SendMessageTimeout is answered the next time the thread pumps messages.
+        Sent messages are dispatched ahead of queued input and posted messages, so a reply does NOT
+        mean earlier SendInput keys were handled or that a new dialog/panel exists - steps that wait
+        for UI to appear must check for it (wait_for_window, wait_for_image, focus change) or pass min_ms.
+
+        Args:
+            timeout_ms: Maximum total time to wait (milliseconds)
+            probe_ms: Timeout for each WM_NULL probe (milliseconds)
+            hwnd: Window handle (optional)
+            min_ms: Minimum time to wait even if the window replies at once (milliseconds)
+
+        Returns:
+            bool: True if the window responded within the timeout
+        """
+        target = hwnd or self.hwnd
+        start = time.time()
+        deadline = start + timeout_ms / 1000.0
+        result = ctypes.c_size_t()
+        responded = False
+        delay = 0.005
+        while target and win32gui.IsWindow(target):
+            if ctypes.windll.user32.SendMessageTimeoutW(target, win32con.WM_NULL, 0, 0,
+                                                        SMTO_BLOCK | SMTO_ABORTIFHUNG, probe_ms,
+                                                        ctypes.byref(result)):
+                responded = True
+                break
+            # A hung window fails the probe immediately - back off instead of spinning
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.05)
+        
+        remaining_min = start + min_ms / 1000.0 - time.time()
+        if remaining_min > 0:
+            time.sleep(remaining_min)
+        return responded
+
     def _count_tree_nodes(self):
         """
         Count total tree nodes (expanded + collapsed) in the current window.